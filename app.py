@@ -1,13 +1,26 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    # Handlers import from "app"; without the alias this file would run twice.
+    sys.modules["app"] = sys.modules[__name__]
+
+if os.getenv("STARTUP_PROFILE"):
+    from utils.startup_profiler import StartupProfiler
+
+    StartupProfiler.install()
+
 import asyncio
 import logging
-import os
+import secrets
 
 import betterlogging as bt
 import django
-from aiocryptopay import AioCryptoPay, Networks
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.webhook.aiohttp_server import setup_application
+from aiohttp import web
 from dotenv import load_dotenv
 
 
@@ -15,15 +28,20 @@ def setup_django():
     os.environ.setdefault(
         "DJANGO_SETTINGS_MODULE", "django_project.telegrambot.telegrambot.settings"
     )
-    os.environ.update({"DJANGO_ALLOW_ASYNC_UNSAFE": "true"})
     django.setup()
 
 
 setup_django()
 
-from app_config import env_config
+from app_config import db_config, env_config
 from localization import setup_localization
 from middlewares.I18n import I18nMiddleware
+from middlewares.menu_callback import MenuCallBackMiddleware
+from utils.fsm_storage import DjangoStorage, build_fsm_storage
+from utils.startup_profiler import StartupProfiler
+from utils.webhook import QueuedRequestHandler
+
+StartupProfiler.mark("imports")
 
 load_dotenv()
 
@@ -31,19 +49,14 @@ bot = Bot(
     token=env_config.TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML)
 )
 
-CRYPTO_TOKEN = env_config.CRYPTO_TOKEN
-crypto_client = AioCryptoPay(CRYPTO_TOKEN, network=Networks.TEST_NET)
-
 bot.my_admins_list: list[int] = env_config.ADMIN_USER_LIST
 CHANNEL_ID: str = env_config.CHANNEL_ID
 CHANNEL_LINK: str = env_config.CHANNEL_LINK
 
-dp = Dispatcher()
+dp = Dispatcher(storage=build_fsm_storage())
 
 
-async def on_startup(bot):
-    from django.core.management import call_command
-
+def setup_routers(dispatcher: Dispatcher) -> None:
     from handlers.admin_private import admin_router
     from handlers.captcha import captcha_router
     from handlers.check_subscription import subscription_router
@@ -52,23 +65,58 @@ async def on_startup(bot):
     from handlers.registration import registration_router
     from handlers.user_group import user_group_router
     from handlers.user_private import user_private_router
-
-    dp.include_router(language_router)
-    dp.include_router(admin_router)
-    dp.include_router(registration_router)
-    dp.include_router(captcha_router)
-    dp.include_router(subscription_router)
-    dp.include_router(order_router)
-    dp.include_router(user_private_router)
-    dp.include_router(user_group_router)
-
-    call_command("migrate")
-    call_command("loaddata", "fixtures/categories.json")
-    call_command("loaddata", "fixtures/products.json")
-    call_command("loaddata", "fixtures/banners.json")
+    from utils.callback_index import CallbackIndex
+
+    dispatcher.include_router(language_router)
+    dispatcher.include_router(admin_router)
+    dispatcher.include_router(registration_router)
+    dispatcher.include_router(captcha_router)
+    dispatcher.include_router(subscription_router)
+    dispatcher.include_router(order_router)
+    dispatcher.include_router(user_private_router)
+    dispatcher.include_router(user_group_router)
+    if env_config.CALLBACK_INDEX:
+        CallbackIndex.install(dispatcher)
+
+
+async def on_startup(bot, translator_hub, dispatcher):
+    from handlers.orders import resume_crypto_payments
+    from utils.broadcaster import Broadcaster
+    from utils.catalog import CatalogSnapshot
+    from utils.db_pool import ConnectionPool
+    from utils.payment_watcher import PaymentWatcher
+    from utils.restricted_words import RestrictedWords
+
+    if isinstance(dp.storage, DjangoStorage):
+        await dp.storage.purge_expired()
+
+    await CatalogSnapshot.refresh()
+    CatalogSnapshot.start_watcher(env_config.CATALOG_REFRESH_INTERVAL)
+    RestrictedWords.start_watcher(env_config.RESTRICTED_WORDS_REFRESH_INTERVAL)
+    await resume_crypto_payments(bot, dispatcher.storage, translator_hub)
+    PaymentWatcher.start(env_config.PAYMENT_POLL_INTERVAL)
+    await Broadcaster.resume(bot, translator_hub)
+    ConnectionPool.start_recycler(db_config.POSTGRES_RECYCLE_INTERVAL)
+    StartupProfiler.mark("startup")
 
 
 async def on_shutdown(bot):
+    from handlers.payment import CryptoApiManager
+    from utils.broadcaster import Broadcaster
+    from utils.catalog import CatalogSnapshot
+    from utils.crypto_client import close_crypto_client
+    from utils.db_pool import ConnectionPool
+    from utils.payment_watcher import PaymentWatcher
+    from utils.restricted_words import RestrictedWords
+
+    Broadcaster.stop_all()
+    CatalogSnapshot.stop_watcher()
+    RestrictedWords.stop_watcher()
+    PaymentWatcher.stop()
+    await CryptoApiManager.close()
+    await close_crypto_client()
+    await dp.storage.close()
+    await ConnectionPool.close()
     print("\033[31mBot stopped!")
 
 
@@ -76,15 +124,68 @@ async def main() -> None:
     bt.basic_colorized_config(level=logging.INFO)
 
     translator_hub = setup_localization()
+    dp["translator_hub"] = translator_hub
 
+    # Routers go in before polling starts: allowed_updates is resolved from them,
+    # and chat_member updates only arrive when asked for explicitly.
+    setup_routers(dp)
     dp.startup.register(on_startup)
 
     dp.update.middleware(I18nMiddleware(translator_hub))
+    dp.callback_query.outer_middleware(MenuCallBackMiddleware())
+    if StartupProfiler.enabled:
+        dp.update.outer_middleware(StartupProfiler.first_update_middleware)
 
     dp.shutdown.register(on_shutdown)
 
-    await bot.delete_webhook(drop_pending_updates=True)
-    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+    allowed_updates = dp.resolve_used_update_types()
+    if env_config.BOT_MODE == "webhook":
+        await run_webhook(allowed_updates)
+    else:
+        await run_polling(allowed_updates)
+
+
+async def run_polling(allowed_updates: list[str]) -> None:
+    await bot.delete_webhook(drop_pending_updates=env_config.DROP_PENDING_UPDATES)
+    await dp.start_polling(bot, allowed_updates=allowed_updates)
+
+
+async def run_webhook(allowed_updates: list[str]) -> None:
+    from utils.payment_watcher import PaymentWatcher
+
+    secret_token = env_config.WEBHOOK_SECRET or secrets.token_urlsafe(32)
+
+    async def set_webhook(bot):
+        await bot.set_webhook(
+            url=f"{env_config.WEBHOOK_BASE_URL.rstrip('/')}{env_config.WEBHOOK_PATH}",
+            secret_token=secret_token,
+            allowed_updates=allowed_updates,
+            max_connections=env_config.WEBHOOK_MAX_CONNECTIONS,
+            drop_pending_updates=env_config.DROP_PENDING_UPDATES,
+        )
+
+    dp.startup.register(set_webhook)
+
+    app = web.Application()
+    QueuedRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        workers=env_config.WEBHOOK_WORKERS,
+        queue_size=env_config.WEBHOOK_QUEUE_SIZE,
+        secret_token=secret_token,
+    ).register(app, path=env_config.WEBHOOK_PATH)
+    PaymentWatcher.register(app, path=env_config.CRYPTO_WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(
+            runner, host=env_config.WEBAPP_HOST, port=env_config.WEBAPP_PORT
+        ).start()
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
 
 
 if __name__ == "__main__":
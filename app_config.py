@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +24,53 @@ class EnvConfig(BaseSettings):
     )
 
     RATE_API_URL: str
+    RATE_CACHE_TTL: int = 60
+    RATE_STALE_TTL: int = 600
+
+    LANGUAGE_CACHE_TTL: int = 600
+    LANGUAGE_CACHE_SIZE: int = 10_000
+
+    CAPTCHA_CACHE_SIZE: int = 10_000
+    CAPTCHA_NEGATIVE_CACHE_TTL: int = 300
+
+    SUBSCRIPTION_CACHE_SIZE: int = 10_000
+    SUBSCRIPTION_POSITIVE_TTL: int = 600
+    SUBSCRIPTION_NEGATIVE_TTL: int = 30
+
+    CATALOG_REFRESH_INTERVAL: int = 30
+
+    RESTRICTED_WORDS_PATH: str = "files/restricted_words.txt"
+    RESTRICTED_WORDS_REFRESH_INTERVAL: float = 30
+
+    FSM_STORAGE: Literal["memory", "redis", "postgres"] = "memory"
+    FSM_STATE_TTL: int = 86_400
+    FSM_DATA_TTL: int = 86_400
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    PAYMENT_POLL_INTERVAL: float = 5
+    PAYMENT_TIMEOUT: int = 180
+    CRYPTO_WEBHOOK_PATH: str = "/cryptopay"
+
+    BROADCAST_RATE: float = 25
+    BROADCAST_CHUNK_SIZE: int = 500
+    BROADCAST_BATCH_SIZE: int = 25
+    BROADCAST_MAX_RETRIES: int = 3
+    BROADCAST_PROGRESS_INTERVAL: float = 5
+    BROADCAST_ALBUM_DELAY: float = 0.5
+
+    CALLBACK_INDEX: bool = False
+
+    BOT_MODE: Literal["polling", "webhook"] = "polling"
+    DROP_PENDING_UPDATES: bool = False
+
+    WEBHOOK_BASE_URL: str = ""
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: str = ""
+    WEBHOOK_MAX_CONNECTIONS: int = 40
+    WEBHOOK_WORKERS: int = 32
+    WEBHOOK_QUEUE_SIZE: int = 1_000
+    WEBAPP_HOST: str = "0.0.0.0"
+    WEBAPP_PORT: int = 8080
 
     ADMIN_LIST: str = Field(default="", alias="ADMIN_LIST")
 
@@ -55,6 +102,12 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
+    POSTGRES_CONN_MAX_AGE: int = 600
+    POSTGRES_CONN_HEALTH_CHECKS: bool = True
+    POSTGRES_POOL_MIN_SIZE: int = 2
+    POSTGRES_POOL_MAX_SIZE: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 10
+    POSTGRES_RECYCLE_INTERVAL: float = 60
 
     DJANGO_SUPERUSER_USERNAME: str = "test"
     DJANGO_SUPERUSER_EMAIL: str = "test@gmail.com"
@@ -0,0 +1,113 @@
+"""Measure per-update callback query dispatch with and without CallbackIndex.
+
+Routers mirror app.on_startup: several routers included one after another, each
+with prefix, exact and callback data filters. Updates target the last router,
+which is the worst case for the plain linear search.
+
+Run from the repository root: python benchmarks/callback_dispatch.py
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from utils.callback_index import CallbackIndex
+
+NUMBER = 2_000
+ROUTERS = 7
+
+
+class ItemCallBack(CallbackData, prefix="item"):
+    item_id: int
+
+
+def build_dispatcher(handlers_per_router: int, calls: list[str]) -> Dispatcher:
+    dp = Dispatcher()
+    for router_index in range(ROUTERS):
+        router = Router(name=f"router_{router_index}")
+        for handler_index in range(handlers_per_router):
+            name = f"r{router_index}h{handler_index}"
+
+            async def handler(callback: CallbackQuery, name: str = name) -> str:
+                calls.append(name)
+                return name
+
+            if handler_index == 2:
+                router.callback_query.register(
+                    handler, ItemCallBack.filter(F.item_id == router_index)
+                )
+            elif handler_index % 2:
+                router.callback_query.register(handler, F.data == name)
+            else:
+                router.callback_query.register(handler, F.data.startswith(f"{name}_"))
+        dp.include_router(router)
+    return dp
+
+
+def callback_update(bot: Bot, data: str) -> Update:
+    user = User(id=1, is_bot=False, first_name="Test")
+    message = Message(
+        message_id=1,
+        date=datetime.now(),
+        chat=Chat(id=1, type="private"),
+        from_user=user,
+        text="menu",
+    )
+    return Update(
+        update_id=1,
+        callback_query=CallbackQuery(
+            id="1", from_user=user, chat_instance="1", message=message, data=data
+        ),
+    ).as_(bot)
+
+
+async def measure(dp: Dispatcher, bot: Bot, updates: list[Update]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(NUMBER // len(updates)):
+        for update in updates:
+            await dp.feed_update(bot, update)
+    return (time.perf_counter() - started_at) / (NUMBER // len(updates) * len(updates))
+
+
+async def main() -> None:
+    bot = Bot(token="42:TEST")
+    print(f"{ROUTERS} routers, updates handled by the last one")
+    for handlers_per_router in (3, 12, 48):
+        last = ROUTERS - 1
+        updates = [
+            callback_update(bot, f"r{last}h0_payload"),
+            callback_update(bot, f"r{last}h1"),
+            callback_update(bot, ItemCallBack(item_id=last).pack()),
+            callback_update(bot, "unknown"),
+        ]
+        expected = [f"r{last}h0", f"r{last}h1", f"r{last}h2"]
+
+        timings = []
+        for indexed in (False, True):
+            calls = []
+            dp = build_dispatcher(handlers_per_router, calls)
+            if indexed:
+                CallbackIndex.install(dp)
+            for update in updates:
+                await dp.feed_update(bot, update)
+            assert calls == expected, calls
+            timings.append(await measure(dp, bot, updates))
+
+        before, after = timings
+        print(
+            f"{ROUTERS * handlers_per_router:5} handlers"
+            f" {before * 1e6:9.1f} us -> {after * 1e6:6.1f} us  x{before / after:.1f}"
+        )
+    await bot.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
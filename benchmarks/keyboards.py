@@ -0,0 +1,118 @@
+"""Compare cached keyboards and callback templates with building them from scratch.
+
+Run from the repository root: python benchmarks/keyboards.py
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "django_project.telegrambot.telegrambot.settings"
+)
+
+import django
+
+django.setup()
+
+from aiogram.types import InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from callbacks.callbacks import MenuCallBack
+from keybords.inline import (CATEGORY_PAGES, get_inline_back_button,
+                             get_language_selection_keyboard,
+                             get_products_btns, get_select_payment_keyboard,
+                             get_user_main_btns)
+from localization import setup_localization
+
+NUMBER = 2_000
+
+
+def build_products_btns(*, i18n, level, category, page, pagination_btns, product_id):
+    keyboard = InlineKeyboardBuilder()
+    keyboard.add(
+        InlineKeyboardButton(
+            text=i18n.back_button(),
+            callback_data=MenuCallBack(level=level - 1, menu_name="catalog").pack(),
+        ),
+        InlineKeyboardButton(
+            text=i18n.cart_button(),
+            callback_data=MenuCallBack(level=3, menu_name="cart").pack(),
+        ),
+        InlineKeyboardButton(
+            text=i18n.buy_button(),
+            callback_data=MenuCallBack(
+                level=level, menu_name="add_to_cart", product_id=product_id
+            ).pack(),
+        ),
+    )
+    keyboard.adjust(2, 1)
+    row = [
+        InlineKeyboardButton(
+            text=text,
+            callback_data=MenuCallBack(
+                level=level,
+                menu_name=menu_name,
+                category=category,
+                page=page + 1 if menu_name == "next" else page - 1,
+            ).pack(),
+        )
+        for text, menu_name in pagination_btns.items()
+    ]
+    return keyboard.row(*row).as_markup()
+
+
+def report(name: str, baseline, optimized) -> None:
+    before = min(timeit.repeat(baseline, number=NUMBER, repeat=3)) / NUMBER
+    after = min(timeit.repeat(optimized, number=NUMBER, repeat=3)) / NUMBER
+    print(
+        f"{name:<32} {before * 1e6:8.2f} us -> {after * 1e6:6.2f} us"
+        f"  x{before / after:.1f}"
+    )
+
+
+def main() -> None:
+    hub = setup_localization()
+    i18n = hub.get_translator_by_locale("en")
+
+    for keyboard in (
+        get_inline_back_button,
+        get_select_payment_keyboard,
+        get_language_selection_keyboard,
+    ):
+        report(
+            keyboard.__name__,
+            lambda: keyboard.__wrapped__(i18n=i18n),
+            lambda: keyboard(i18n=i18n),
+        )
+
+    report(
+        "get_user_main_btns",
+        lambda: get_user_main_btns.__wrapped__(level=0, i18n=i18n),
+        lambda: get_user_main_btns(level=0, i18n=i18n),
+    )
+
+    report(
+        "MenuCallBack pagination",
+        lambda: MenuCallBack(level=2, menu_name="next", category=5, page=4).pack(),
+        lambda: CATEGORY_PAGES["next"].pack(level=2, category=5, page=4),
+    )
+
+    products_kwargs = dict(
+        level=2,
+        category=5,
+        page=3,
+        pagination_btns={i18n.prev_button(): "previous", i18n.next_button(): "next"},
+        product_id=42,
+    )
+    report(
+        "get_products_btns",
+        lambda: build_products_btns(i18n=i18n, **products_kwargs),
+        lambda: get_products_btns(i18n=i18n, user_language="en", **products_kwargs),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare restricted word matching strategies on a large generated word list.
+
+Run from the repository root: python benchmarks/restricted_words.py
+"""
+
+import random
+import string
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.restricted_words import RestrictedWordsMatcher
+from utils.text_processing import clean_text, normalize_text
+
+NUMBER = 200
+TERMS = (1_000, 10_000, 50_000)
+MESSAGES = 50
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def generate_terms(rng: random.Random, count: int) -> list[str]:
+    terms = []
+    for index in range(count):
+        if index % 10 == 0:
+            terms.append(f"{random_word(rng)} {random_word(rng)}")
+        elif index % 10 == 1:
+            terms.append(f"{random_word(rng)}*")
+        else:
+            terms.append(random_word(rng))
+    return terms
+
+
+def generate_messages(rng: random.Random, terms: list[str]) -> list[str]:
+    messages = []
+    for index in range(MESSAGES):
+        words = [random_word(rng) for _ in range(30)]
+        if index % 5 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice(terms).rstrip("*"))
+        messages.append(" ".join(words).capitalize() + ".")
+    return messages
+
+
+def per_message(func, messages: list[str], number: int) -> float:
+    def run():
+        for message in messages:
+            func(message)
+
+    return min(timeit.repeat(run, number=number, repeat=3)) / number / len(messages)
+
+
+def main() -> None:
+    rng = random.Random(42)
+    for count in TERMS:
+        terms = generate_terms(rng, count)
+        messages = generate_messages(rng, terms)
+
+        started_at = time.perf_counter()
+        matcher = RestrictedWordsMatcher(terms)
+        build_time = time.perf_counter() - started_at
+
+        words = {term.lower() for term in terms}
+        patterns = [
+            f" {normalize_text(term.rstrip('*'))}{'' if term.endswith('*') else ' '}"
+            for term in terms
+        ]
+
+        def word_set(message: str) -> bool:
+            return bool(words.intersection(clean_text(message.lower()).split()))
+
+        def linear_scan(message: str) -> bool:
+            text = f" {normalize_text(message)} "
+            return any(pattern in text for pattern in patterns)
+
+        def automaton(message: str) -> bool:
+            return matcher.find(message) is not None
+
+        # The automaton also accepts stretched letters, so it may find more.
+        for message in messages:
+            assert automaton(message) or not linear_scan(message), message
+
+        print(f"{count} terms, automaton built in {build_time * 1000:.0f} ms")
+        for name, func, number in (
+            ("word set (words only)", word_set, NUMBER),
+            ("linear scan", linear_scan, max(1, NUMBER * 1_000 // count)),
+            ("automaton", automaton, NUMBER),
+        ):
+            print(f"  {name:<24} {per_message(func, messages, number) * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,48 @@
+from typing import Any
+
+from aiogram.filters import Filter
 from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+from magic_filter import MagicFilter
+
+from callbacks.menu_codec import (LEGACY_PREFIX, PREFIX, MenuData, decode_menu,
+                                  encode_menu)
+
+NOT_DECODED = object()
+
+
+class CallbackTemplate:
+    def __init__(
+        self, callback: type["MenuCallBack"], *dynamic: str, **fixed: Any
+    ) -> None:
+        for name in dynamic:
+            if callback.model_fields[name].annotation not in (int, int | None):
+                raise TypeError(f"Only int fields can be left out, got {name!r}")
+
+        callback(**fixed, **dict.fromkeys(dynamic, 0)).pack()
+        self._encode = callback.encode
+        self._fixed = fixed
+
+    def pack(self, **values: int) -> str:
+        return self._encode(**self._fixed, **values)
+
+
+class MenuCallBackFilter(Filter):
+    callback_prefixes = (PREFIX, LEGACY_PREFIX)
+
+    def __init__(self, rule: MagicFilter | None = None) -> None:
+        self.rule = rule
+
+    async def __call__(
+        self, query: CallbackQuery, menu_callback: Any = NOT_DECODED
+    ) -> bool | dict[str, Any]:
+        if menu_callback is NOT_DECODED:
+            menu_callback = decode_menu(query.data)
+        if menu_callback is None:
+            return False
+        if self.rule is not None and not self.rule.resolve(menu_callback):
+            return False
+        return {"callback_data": menu_callback}
 
 
 class MenuCallBack(CallbackData, prefix="menu"):
@@ -8,6 +52,24 @@ class MenuCallBack(CallbackData, prefix="menu"):
     page: int = 1
     product_id: int | None = None
 
+    encode = staticmethod(encode_menu)
+
+    def pack(self) -> str:
+        return encode_menu(
+            self.level, self.menu_name, self.category, self.page, self.product_id
+        )
+
+    @classmethod
+    def unpack(cls, value: str) -> MenuData:
+        callback_data = decode_menu(value)
+        if callback_data is None:
+            raise ValueError(f"Invalid menu callback data {value!r}")
+        return callback_data
+
+    @classmethod
+    def filter(cls, rule: MagicFilter | None = None) -> MenuCallBackFilter:
+        return MenuCallBackFilter(rule)
+
 
 class OrderDetailCallBack(CallbackData, prefix="order_detail"):
     order_id: str
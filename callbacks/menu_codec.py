@@ -0,0 +1,164 @@
+import binascii
+from typing import NamedTuple
+
+from aiogram.filters.callback_data import MAX_CALLBACK_LENGTH
+
+PREFIX = "m:"
+LEGACY_PREFIX = "menu:"
+VERSION = 1
+
+# Append only: codes are stored in the buttons of messages that were already sent.
+MENU_NAMES = (
+    "main",
+    "catalog",
+    "products",
+    "cart",
+    "orders",
+    "order",
+    "about",
+    "payment",
+    "shipping",
+    "profile",
+    "language",
+    "add_to_cart",
+    "delete",
+    "decrement",
+    "increment",
+    "next",
+    "previous",
+)
+MENU_CODES = {name: code for code, name in enumerate(MENU_NAMES, start=1)}
+CUSTOM_MENU_NAME = 0
+
+HAS_CATEGORY = 1
+HAS_PAGE = 2
+HAS_PRODUCT = 4
+
+
+class MenuData(NamedTuple):
+    level: int
+    menu_name: str
+    category: int | None = None
+    page: int = 1
+    product_id: int | None = None
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    _write_uvarint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _read_uvarint(data: bytes, position: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value, position = _read_uvarint(data, position)
+    return (value >> 1) ^ -(value & 1), position
+
+
+def encode_menu(
+    level: int,
+    menu_name: str,
+    category: int | None = None,
+    page: int = 1,
+    product_id: int | None = None,
+) -> str:
+    out = bytearray((VERSION,))
+    code = MENU_CODES.get(menu_name)
+    if code is None:
+        name = menu_name.encode()
+        out.append(CUSTOM_MENU_NAME)
+        _write_uvarint(out, len(name))
+        out += name
+    else:
+        out.append(code)
+    _write_varint(out, level)
+
+    flags = 0
+    if category is not None:
+        flags |= HAS_CATEGORY
+    if page != 1:
+        flags |= HAS_PAGE
+    if product_id is not None:
+        flags |= HAS_PRODUCT
+    out.append(flags)
+    if flags & HAS_CATEGORY:
+        _write_varint(out, category)
+    if flags & HAS_PAGE:
+        _write_varint(out, page)
+    if flags & HAS_PRODUCT:
+        _write_varint(out, product_id)
+
+    encoded = binascii.b2a_base64(out, newline=False).rstrip(b"=").decode()
+    callback_data = PREFIX + encoded.replace("+", "-").replace("/", "_")
+    if len(callback_data) > MAX_CALLBACK_LENGTH:
+        raise ValueError(f"Resulted callback data is too long: {callback_data!r}")
+    return callback_data
+
+
+def _decode(encoded: str) -> MenuData | None:
+    # a2b_base64 ignores excess padding, so the stripped one can be restored blindly.
+    data = binascii.a2b_base64(encoded.replace("-", "+").replace("_", "/") + "===")
+    if data[0] != VERSION:
+        return None
+
+    code = data[1]
+    position = 2
+    if code == CUSTOM_MENU_NAME:
+        length, position = _read_uvarint(data, position)
+        menu_name = data[position : position + length].decode()
+        position += length
+    else:
+        menu_name = MENU_NAMES[code - 1]
+    level, position = _read_varint(data, position)
+
+    flags = data[position]
+    position += 1
+    category = product_id = None
+    page = 1
+    if flags & HAS_CATEGORY:
+        category, position = _read_varint(data, position)
+    if flags & HAS_PAGE:
+        page, position = _read_varint(data, position)
+    if flags & HAS_PRODUCT:
+        product_id, position = _read_varint(data, position)
+    return MenuData(level, menu_name, category, page, product_id)
+
+
+def _decode_legacy(encoded: str) -> MenuData:
+    level, menu_name, category, page, product_id = encoded.split(":")
+    return MenuData(
+        int(level),
+        menu_name,
+        int(category) if category else None,
+        int(page),
+        int(product_id) if product_id else None,
+    )
+
+
+def decode_menu(callback_data: str | None) -> MenuData | None:
+    if not callback_data:
+        return None
+    try:
+        if callback_data.startswith(PREFIX):
+            return _decode(callback_data[len(PREFIX) :])
+        # Buttons of messages sent before the binary format was introduced.
+        if callback_data.startswith(LEGACY_PREFIX):
+            return _decode_legacy(callback_data[len(LEGACY_PREFIX) :])
+    except (IndexError, ValueError, binascii.Error):
+        pass
+    return None
@@ -103,7 +103,7 @@ PARLER_LANGUAGES = {
 # settings.py
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql_psycopg2",
+        "ENGINE": "django.db.backends.postgresql",
         "NAME": db_config.POSTGRES_DB,
         "USER": db_config.POSTGRES_USER,
         "PASSWORD": db_config.POSTGRES_PASSWORD,
@@ -111,9 +111,22 @@ DATABASES = {
         "PORT": db_config.POSTGRES_PORT,
         "CHARSET": "utf8",
         "USE_UNICODE": True,
+        "CONN_MAX_AGE": db_config.POSTGRES_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": db_config.POSTGRES_CONN_HEALTH_CHECKS,
+        "OPTIONS": {},
     }
 }
 
+# A pool hands connections back on close, so it can't be combined with
+# persistent connections. POSTGRES_POOL_MAX_SIZE=0 falls back to CONN_MAX_AGE.
+if db_config.POSTGRES_POOL_MAX_SIZE:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": db_config.POSTGRES_POOL_MIN_SIZE,
+        "max_size": db_config.POSTGRES_POOL_MAX_SIZE,
+        "timeout": db_config.POSTGRES_POOL_TIMEOUT,
+    }
+
 AUTH_USER_MODEL = "usersmanage.AdminUser"
 
 
@@ -2,8 +2,9 @@ from django.contrib import admin
 from django.utils.html import format_html
 from parler.admin import TranslatableAdmin
 
-from .models import (AdminUser, Banner, CaptchaRecord, Cart, Category, Order,
-                     OrderItem, Product, TelegramUser)
+from .models import (AdminUser, Banner, Broadcast, CaptchaRecord, Cart,
+                     Category, FixtureVersion, FSMRecord, MediaFile, Order,
+                     OrderItem, PendingPayment, Product, TelegramUser)
 
 
 @admin.register(AdminUser)
@@ -131,3 +132,44 @@ class CaptchaRecordAdmin(admin.ModelAdmin):
     search_fields = ("user__first_name", "user__last_name", "captcha")
     list_filter = ("timestamp", "created_at", "updated_at")
     raw_id_fields = ("user",)
+
+
+@admin.register(MediaFile)
+class MediaFileAdmin(admin.ModelAdmin):
+    list_display = ("id", "path", "file_id", "created_at", "updated_at")
+    search_fields = ("path",)
+    list_filter = ("created_at", "updated_at")
+
+
+@admin.register(FSMRecord)
+class FSMRecordAdmin(admin.ModelAdmin):
+    list_display = ("id", "key", "state", "expires_at", "updated_at")
+    search_fields = ("key", "state")
+    list_filter = ("expires_at", "updated_at")
+
+
+@admin.register(PendingPayment)
+class PendingPaymentAdmin(admin.ModelAdmin):
+    list_display = ("invoice_id", "user", "crypto", "amount", "expires_at")
+    search_fields = ("invoice_id", "user__user_id", "name", "phone")
+    list_filter = ("crypto", "expires_at")
+
+
+@admin.register(Broadcast)
+class BroadcastAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "admin_id",
+        "status",
+        "total",
+        "success_count",
+        "error_count",
+        "created_at",
+    )
+    list_filter = ("status", "created_at")
+
+
+@admin.register(FixtureVersion)
+class FixtureVersionAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "checksum", "updated_at")
+    search_fields = ("name",)
@@ -0,0 +1,46 @@
+import hashlib
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from django_project.telegrambot.usersmanage.models import FixtureVersion
+
+DEFAULT_FIXTURES = (
+    "fixtures/categories.json",
+    "fixtures/products.json",
+    "fixtures/banners.json",
+)
+
+
+class Command(BaseCommand):
+    help = "Load fixtures whose contents changed since they were last applied."
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixtures", nargs="*", default=DEFAULT_FIXTURES)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Reload fixtures even if their checksum is unchanged.",
+        )
+
+    def handle(self, *args, **options):
+        applied = dict(FixtureVersion.objects.values_list("name", "checksum"))
+
+        for fixture in options["fixtures"]:
+            path = Path(fixture)
+            if not path.is_file():
+                raise CommandError(f"Fixture {fixture} does not exist")
+
+            checksum = hashlib.sha256(path.read_bytes()).hexdigest()
+            if not options["force"] and applied.get(path.name) == checksum:
+                self.stdout.write(f"{path.name}: up to date")
+                continue
+
+            with transaction.atomic():
+                call_command("loaddata", str(path), verbosity=0)
+                FixtureVersion.objects.update_or_create(
+                    name=path.name, defaults={"checksum": checksum}
+                )
+            self.stdout.write(self.style.SUCCESS(f"{path.name}: applied"))
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0007_remove_product_description_remove_product_name_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaFile",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("path", models.CharField(max_length=255, unique=True)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("file_id", models.CharField(max_length=255)),
+            ],
+            options={
+                "verbose_name": "Media File",
+                "verbose_name_plural": "Media Files",
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:40
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0008_mediafile"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FSMRecord",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("state", models.CharField(blank=True, max_length=255, null=True)),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+            ],
+            options={
+                "verbose_name": "FSM Record",
+                "verbose_name_plural": "FSM Records",
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:55
+
+import django.core.serializers.json
+import django.db.models.deletion
+import phonenumber_field.modelfields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0009_fsmrecord"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingPayment",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("invoice_id", models.BigIntegerField(unique=True)),
+                ("crypto", models.CharField(max_length=10)),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("language", models.CharField(max_length=10)),
+                ("name", models.CharField(max_length=150)),
+                ("address", models.TextField()),
+                (
+                    "phone",
+                    phonenumber_field.modelfields.PhoneNumberField(
+                        max_length=128, region=None
+                    ),
+                ),
+                (
+                    "items",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(db_index=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_payments",
+                        to="usersmanage.telegramuser",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending Payment",
+                "verbose_name_plural": "Pending Payments",
+            },
+        ),
+    ]
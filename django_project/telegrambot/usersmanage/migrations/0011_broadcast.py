@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0010_pendingpayment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Broadcast",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("admin_id", models.BigIntegerField()),
+                ("text", models.TextField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "running"), ("completed", "completed")],
+                        db_index=True,
+                        default="running",
+                        max_length=25,
+                    ),
+                ),
+                ("total", models.IntegerField(default=0)),
+                ("last_user_id", models.IntegerField(default=0)),
+                ("success_count", models.IntegerField(default=0)),
+                ("error_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Broadcast",
+                "verbose_name_plural": "Broadcasts",
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0011_broadcast"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="broadcast",
+            name="text",
+        ),
+        migrations.AddField(
+            model_name="broadcast",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-18 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0012_broadcast_variants"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FixtureVersion",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("checksum", models.CharField(max_length=64)),
+            ],
+            options={
+                "verbose_name": "Fixture Version",
+                "verbose_name_plural": "Fixture Versions",
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("usersmanage", "0013_fixtureversion"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="broadcast",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("running", "running"),
+                    ("completed", "completed"),
+                    ("failed", "failed"),
+                ],
+                db_index=True,
+                default="running",
+                max_length=25,
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ import uuid
 
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import AbstractUser, PermissionsMixin
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -19,6 +20,12 @@ LANGUAGE = (
     ("ru", "Russian"),
 )
 
+BROADCAST_STATUS = (
+    ("running", "running"),
+    ("completed", "completed"),
+    ("failed", "failed"),
+)
+
 
 class TimeBasedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -176,3 +183,88 @@ class CaptchaRecord(TimeBasedModel):
 
     def __str__(self):
         return f"Captcha {self.id} - User {self.user.id}"
+
+
+class MediaFile(TimeBasedModel):
+    id = models.AutoField(primary_key=True)
+    path = models.CharField(max_length=255, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    file_id = models.CharField(max_length=255)
+
+    class Meta:
+        verbose_name_plural: str = "Media Files"
+        verbose_name: str = "Media File"
+
+    def __str__(self):
+        return f"MediaFile {self.path}"
+
+
+class FSMRecord(TimeBasedModel):
+    id = models.AutoField(primary_key=True)
+    key = models.CharField(max_length=255, unique=True)
+    state = models.CharField(max_length=255, blank=True, null=True)
+    data = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(blank=True, null=True, db_index=True)
+
+    class Meta:
+        verbose_name_plural: str = "FSM Records"
+        verbose_name: str = "FSM Record"
+
+    def __str__(self):
+        return f"FSMRecord {self.key}"
+
+
+class PendingPayment(TimeBasedModel):
+    id = models.AutoField(primary_key=True)
+    invoice_id = models.BigIntegerField(unique=True)
+    user = models.ForeignKey(
+        TelegramUser, on_delete=models.CASCADE, related_name="pending_payments"
+    )
+    crypto = models.CharField(max_length=10)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    language = models.CharField(max_length=10)
+    name = models.CharField(max_length=150)
+    address = models.TextField()
+    phone = PhoneNumberField()
+    items = models.JSONField(default=list, blank=True, encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name_plural: str = "Pending Payments"
+        verbose_name: str = "Pending Payment"
+
+    def __str__(self):
+        return f"PendingPayment {self.invoice_id}"
+
+
+class Broadcast(TimeBasedModel):
+    id = models.AutoField(primary_key=True)
+    admin_id = models.BigIntegerField()
+    variants = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=25, choices=BROADCAST_STATUS, default="running", db_index=True
+    )
+    total = models.IntegerField(default=0)
+    last_user_id = models.IntegerField(default=0)
+    success_count = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural: str = "Broadcasts"
+        verbose_name: str = "Broadcast"
+
+    def __str__(self):
+        return f"Broadcast {self.id}"
+
+
+class FixtureVersion(TimeBasedModel):
+    id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=255, unique=True)
+    checksum = models.CharField(max_length=64)
+
+    class Meta:
+        verbose_name_plural: str = "Fixture Versions"
+        verbose_name: str = "Fixture Version"
+
+    def __str__(self):
+        return f"FixtureVersion {self.name}"
@@ -1,3 +1,408 @@
-from django.test import TestCase
+import asyncio
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from aiogram import Dispatcher
+from aiogram.filters.callback_data import CallbackData
+from aiogram.fsm.storage.base import DefaultKeyBuilder, StorageKey
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from fakeredis import FakeAsyncRedis
+
+from app import setup_routers
+from callbacks.callbacks import MenuCallBack
+from callbacks.menu_codec import MENU_NAMES, MenuData, decode_menu
+from queries.cart_queries import get_cart_items
+from queries.category_queries import get_categories
+from queries.order_queries import add_order_with_items, get_order_items
+from queries.payment_queries import (complete_pending_payment,
+                                     create_pending_payment)
+from queries.products_queries import get_products
+from states.order_state import OrderState
+from utils.fsm_storage import DjangoStorage, RedisHashStorage
+from utils.restricted_words import RestrictedWordsMatcher
+
+from .models import (Cart, Category, FSMRecord, Order, OrderItem,
+                     PendingPayment, Product, TelegramUser)
+
+
+def create_translated(model, translations: dict[str, dict], **fields):
+    obj = model(**fields)
+    for language_code, values in translations.items():
+        obj.set_current_language(language_code)
+        for name, value in values.items():
+            setattr(obj, name, value)
+    obj.save()
+    return obj
+
+
+class TranslationPrefetchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = create_translated(
+            Category, {"en": {"name": "Food"}, "ru": {"name": "Еда"}}
+        )
+        create_translated(
+            Category, {"en": {"name": "Beverages"}, "ru": {"name": "Напитки"}}
+        )
+
+        cls.products = [
+            create_translated(
+                Product,
+                {
+                    "en": {"name": f"Pizza {i}", "description": "Tasty"},
+                    "ru": {"name": f"Пицца {i}", "description": "Вкусно"},
+                },
+                price=10 + i,
+                category=cls.category,
+            )
+            for i in range(5)
+        ]
+        cls.products.append(
+            create_translated(
+                Product,
+                {"en": {"name": "Untranslated", "description": "English only"}},
+                price=1,
+                category=cls.category,
+            )
+        )
+
+        cls.user = TelegramUser.objects.create(
+            user_id=1, first_name="Test", phone_number="+380501234567"
+        )
+        cls.order = Order.objects.create(
+            user=cls.user, name="Test", phone="+380501234567", address="Street 1"
+        )
+        for product in cls.products:
+            Cart.objects.create(user=cls.user, product=product, quantity=1)
+            OrderItem.objects.create(
+                order=cls.order, product=product, quantity=1, price=product.price
+            )
+
+    def test_categories_use_constant_queries(self):
+        with self.assertNumQueries(2):
+            names = [c.name for c in async_to_sync(get_categories)("ru")]
+
+        self.assertEqual(names, ["Еда", "Напитки"])
+
+    def test_products_use_constant_queries(self):
+        with self.assertNumQueries(2):
+            names = [
+                p.name for p in async_to_sync(get_products)(self.category.id, "ru")
+            ]
+
+        self.assertEqual(names, [f"Пицца {i}" for i in range(5)] + ["Untranslated"])
+
+    def test_cart_items_use_constant_queries(self):
+        with self.assertNumQueries(2):
+            names = [c.product.name for c in async_to_sync(get_cart_items)(1, "ru")]
+
+        self.assertEqual(len(names), len(self.products))
+
+    def test_order_items_use_constant_queries(self):
+        with self.assertNumQueries(2):
+            names = [
+                i.product.name
+                for i in async_to_sync(get_order_items)(self.order.id, "en")
+            ]
+
+        self.assertIn("Pizza 0", names)
+
+
+class CheckoutTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = create_translated(Category, {"en": {"name": "Food"}})
+        cls.user = TelegramUser.objects.create(
+            user_id=2, first_name="Buyer", phone_number="+380501234568"
+        )
+        for i in range(10):
+            product = create_translated(
+                Product,
+                {"en": {"name": f"Pizza {i}", "description": "Tasty"}},
+                price=Decimal("2.50"),
+                category=category,
+            )
+            Cart.objects.create(user=cls.user, product=product, quantity=2)
+
+    def test_checkout_uses_constant_queries(self):
+        async_to_sync(create_pending_payment)(
+            invoice_id=1000,
+            user_id=2,
+            crypto="USDT",
+            amount=50.0,
+            language="en",
+            name="Buyer",
+            phone="+380501234568",
+            address="Street 1",
+            timeout=180,
+        )
+
+        with self.assertNumQueries(11):
+            _, order = async_to_sync(complete_pending_payment)(1000)
+
+        self.assertEqual(order.items.count(), 10)
+        self.assertEqual(order.items_count, 20)
+        self.assertEqual(order.total, Decimal("50.00"))
+        self.assertFalse(Cart.objects.filter(user=self.user).exists())
+
+    def test_checkout_with_empty_cart_creates_no_order(self):
+        Cart.objects.filter(user=self.user).delete()
+
+        self.assertIsNone(
+            add_order_with_items(self.user, "Buyer", "+380501234568", "Street 1")
+        )
+        self.assertFalse(Order.objects.filter(user=self.user).exists())
+
+
+class PendingPaymentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = create_translated(Category, {"en": {"name": "Food"}})
+        cls.user = TelegramUser.objects.create(
+            user_id=3, first_name="Payer", phone_number="+380501234569"
+        )
+        cls.products = [
+            create_translated(
+                Product,
+                {"en": {"name": f"Pizza {i}", "description": "Tasty"}},
+                price=Decimal("4.00"),
+                category=category,
+            )
+            for i in range(3)
+        ]
+
+    def create_payment(self, invoice_id: int) -> PendingPayment:
+        return async_to_sync(create_pending_payment)(
+            invoice_id=invoice_id,
+            user_id=3,
+            crypto="USDT",
+            amount=12.0,
+            language="en",
+            name="Payer",
+            phone="+380501234569",
+            address="Street 1",
+            timeout=180,
+        )
+
+    def test_completion_keeps_items_added_after_invoice(self):
+        first, second, third = self.products
+        Cart.objects.create(user=self.user, product=first, quantity=2)
+        Cart.objects.create(user=self.user, product=second, quantity=1)
+        self.create_payment(1001)
+
+        Cart.objects.filter(user=self.user, product=second).update(quantity=3)
+        Cart.objects.create(user=self.user, product=third, quantity=1)
+
+        payment, order = async_to_sync(complete_pending_payment)(1001)
+
+        self.assertEqual(order.items_count, 3)
+        self.assertEqual(order.total, Decimal("12.00"))
+        self.assertEqual(
+            dict(
+                Cart.objects.filter(user=self.user).values_list(
+                    "product_id", "quantity"
+                )
+            ),
+            {second.id: 2, third.id: 1},
+        )
+        self.assertFalse(PendingPayment.objects.filter(invoice_id=1001).exists())
+
+
+STORAGE_KEY = StorageKey(bot_id=1, chat_id=5, user_id=5)
+
+
+class DjangoStorageTests(TestCase):
+    def setUp(self):
+        self.storage = DjangoStorage(state_ttl=60, data_ttl=60)
+
+    def test_state_and_data_round_trip(self):
+        async_to_sync(self.storage.set_state)(STORAGE_KEY, OrderState.address)
+        async_to_sync(self.storage.set_data)(STORAGE_KEY, {"name": "Buyer"})
+        data = async_to_sync(self.storage.update_data)(STORAGE_KEY, {"items": 3})
+
+        self.assertEqual(
+            async_to_sync(self.storage.get_state)(STORAGE_KEY), OrderState.address.state
+        )
+        self.assertEqual(data, {"name": "Buyer", "items": 3})
+        self.assertEqual(async_to_sync(self.storage.get_data)(STORAGE_KEY), data)
+
+    def test_expired_records_are_ignored_and_purged(self):
+        async_to_sync(self.storage.set_state)(STORAGE_KEY, OrderState.name)
+        async_to_sync(self.storage.set_data)(STORAGE_KEY, {"name": "Buyer"})
+        FSMRecord.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertIsNone(async_to_sync(self.storage.get_state)(STORAGE_KEY))
+        self.assertEqual(async_to_sync(self.storage.get_data)(STORAGE_KEY), {})
+        self.assertEqual(async_to_sync(self.storage.purge_expired)(), 1)
+        self.assertFalse(FSMRecord.objects.exists())
+
+    def test_purge_keeps_active_records(self):
+        async_to_sync(self.storage.set_state)(STORAGE_KEY, OrderState.name)
+
+        self.assertEqual(async_to_sync(self.storage.purge_expired)(), 0)
+        self.assertEqual(
+            async_to_sync(self.storage.get_state)(STORAGE_KEY), OrderState.name.state
+        )
+
+
+class RedisHashStorageTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeAsyncRedis()
+        self.storage = RedisHashStorage(
+            redis=self.redis,
+            key_builder=DefaultKeyBuilder(with_destiny=True),
+            state_ttl=60,
+            data_ttl=60,
+        )
+        self.data_key = self.storage.key_builder.build(STORAGE_KEY, "data")
+
+    async def test_state_and_data_round_trip(self):
+        await self.storage.set_state(STORAGE_KEY, OrderState.phone)
+        await self.storage.set_data(STORAGE_KEY, {"name": "Buyer", "phone": None})
+        data = await self.storage.update_data(STORAGE_KEY, {"address": "Street 1"})
+
+        self.assertEqual(
+            await self.storage.get_state(STORAGE_KEY), OrderState.phone.state
+        )
+        self.assertEqual(data, {"name": "Buyer", "phone": None, "address": "Street 1"})
+        self.assertEqual(await self.storage.get_data(STORAGE_KEY), data)
+        self.assertEqual(await self.redis.hget(self.data_key, "address"), b'"Street 1"')
+
+    async def test_set_data_replaces_fields(self):
+        await self.storage.set_data(STORAGE_KEY, {"name": "Buyer", "phone": "1"})
+        await self.storage.set_data(STORAGE_KEY, {"name": "Other"})
+
+        self.assertEqual(await self.storage.get_data(STORAGE_KEY), {"name": "Other"})
+
+        await self.storage.set_data(STORAGE_KEY, {})
+        self.assertEqual(await self.storage.get_data(STORAGE_KEY), {})
+        self.assertFalse(await self.redis.exists(self.data_key))
+
+    async def test_ttl_is_set_and_expired_data_is_gone(self):
+        await self.storage.set_state(STORAGE_KEY, OrderState.phone)
+        await self.storage.update_data(STORAGE_KEY, {"name": "Buyer"})
+        state_key = self.storage.key_builder.build(STORAGE_KEY, "state")
+
+        self.assertTrue(0 < await self.redis.ttl(state_key) <= 60)
+        self.assertTrue(0 < await self.redis.ttl(self.data_key) <= 60)
+
+        await self.redis.pexpire(self.data_key, 1)
+        await self.redis.pexpire(state_key, 1)
+        await asyncio.sleep(0.01)
+        self.assertIsNone(await self.storage.get_state(STORAGE_KEY))
+        self.assertEqual(await self.storage.get_data(STORAGE_KEY), {})
+
+
+class RestrictedWordsMatcherTests(SimpleTestCase):
+    def test_finds_disguised_terms(self):
+        matcher = RestrictedWordsMatcher(
+            ["fuck", "ass", "bad word", "go to hell", "pidor*", "хуй*"]
+        )
+
+        for text, term in (
+            ("FUUUCK you", "fuck"),
+            ("f.u.c.k", "fuck"),
+            ("ok,fuck", "fuck"),
+            ("fuck,you", "fuck"),
+            ("such a bad-word", "bad word"),
+            ("go/to/hell", "go to hell"),
+            ("ｆｕｃｋ", "fuck"),
+            ("kiss my ass", "ass"),
+            ("kiss my asss", "ass"),
+            ("Go to   HELL!", "go to hell"),
+            ("p1d0rasy", "pidor*"),
+            ("ХУЙНЯ", "хуй*"),
+        ):
+            with self.subTest(text=text):
+                self.assertEqual(matcher.find(text), term)
+
+    def test_ignores_innocent_text(self):
+        matcher = RestrictedWordsMatcher(["fuck", "ass", "beech"])
+
+        for text in (
+            "as you wish",
+            "as, said",
+            "class act",
+            "fuckers",
+            "b e e c h",
+            "bech",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(matcher.find(text))
+
+    def test_double_letters_must_match(self):
+        self.assertIsNone(RestrictedWordsMatcher(["as"]).find("kiss my ass"))
+        self.assertEqual(RestrictedWordsMatcher(["as"]).find("asss"), "as")
+        self.assertEqual(RestrictedWordsMatcher(["as", "ass"]).find("ass"), "ass")
+
+
+class DispatcherSetupTests(SimpleTestCase):
+    def test_chat_member_updates_are_requested(self):
+        dispatcher = Dispatcher()
+        setup_routers(dispatcher)
+
+        self.assertIn("chat_member", dispatcher.resolve_used_update_types())
+
+
+class LegacyMenuCallBack(CallbackData, prefix="menu"):
+    # The format menu buttons were packed in before the binary encoding.
+    level: int
+    menu_name: str
+    category: int | None = None
+    page: int = 1
+    product_id: int | None = None
+
+
+class MenuCallBackCodecTests(SimpleTestCase):
+    def test_round_trip(self):
+        largest = 2**63 - 1
+        for data in (
+            MenuData(0, "main"),
+            MenuData(2, "products", category=3, page=4, product_id=17),
+            MenuData(1, "catalog", category=0, page=0, product_id=0),
+            MenuData(-1, "cart", category=-3, page=-2, product_id=-5),
+            MenuData(3, "add_to_cart", largest, largest, largest),
+            MenuData(1, "custom_menu", category=5),
+            *(MenuData(1, menu_name) for menu_name in MENU_NAMES),
+        ):
+            with self.subTest(data=data):
+                packed = MenuCallBack(**data._asdict()).pack()
+
+                self.assertEqual(MenuCallBack.unpack(packed), data)
+                self.assertEqual(decode_menu(packed), data)
+
+    def test_menu_name_length_limit(self):
+        longest = "x" * 41
+        packed = MenuCallBack(level=0, menu_name=longest).pack()
+
+        self.assertEqual(len(packed), 64)
+        self.assertEqual(decode_menu(packed), MenuData(0, longest))
+        with self.assertRaises(ValueError):
+            MenuCallBack(level=0, menu_name=longest + "x").pack()
+
+    def test_decodes_legacy_callbacks(self):
+        for data in (
+            MenuData(0, "main"),
+            MenuData(2, "products", category=3, page=4, product_id=17),
+            MenuData(1, "cart", page=2),
+        ):
+            with self.subTest(data=data):
+                packed = LegacyMenuCallBack(**data._asdict()).pack()
+
+                self.assertTrue(packed.startswith("menu:"))
+                self.assertEqual(decode_menu(packed), data)
+                self.assertEqual(MenuCallBack.unpack(packed), data)
+
+        self.assertEqual(
+            decode_menu("menu:2:products:3:4:17"), MenuData(2, "products", 3, 4, 17)
+        )
+        self.assertEqual(decode_menu("menu:0:main::1:"), MenuData(0, "main"))
+
+    def test_rejects_malformed_callbacks(self):
+        for value in (None, "", "menu:0:main", "menu:x:main::1:", "m:", "m:!!", "cart"):
+            with self.subTest(value=value):
+                self.assertIsNone(decode_menu(value))
+        with self.assertRaises(ValueError):
+            MenuCallBack.unpack("menu:0:main")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import textwrap
 from datetime import datetime
@@ -5,16 +6,19 @@ from datetime import datetime
 from aiogram import F, Router, types
 from aiogram.filters import Command, StateFilter, or_f
 from aiogram.fsm.context import FSMContext
-from aiogram.types import FSInputFile, ReplyKeyboardRemove
+from aiogram.types import ReplyKeyboardRemove
+from django.conf import settings
 from fluentogram import TranslatorRunner
 
 from app import bot
-from django_project.telegrambot.usersmanage.models import TelegramUser
+from app_config import env_config
+from django_project.telegrambot.usersmanage.models import LANGUAGE
 from filters.chat_types import ChatTypeFilter, IsAdmin
 from filters.translated_text import TranslatedText
 from keybords.inline import get_callback_btns
 from keybords.reply import get_admin_keyboard
 from queries.banner_queries import change_banner_image, get_info_pages
+from queries.broadcast_queries import create_broadcast
 from queries.category_queries import get_categories
 from queries.order_queries import total_orders
 from queries.products_queries import (add_product, delete_product, get_product,
@@ -25,7 +29,12 @@ from queries.user_queries import total_users
 from states.banner_state import AddBanner
 from states.newsletter import Newsletter
 from states.product_state import AddProduct
+from utils.broadcaster import Broadcaster
+from utils.catalog import CatalogSnapshot
+from utils.db_pool import ConnectionPool
 from utils.download_photo import download_telegram_photo
+from utils.media_cache import MediaCache
+from utils.ttl_cache import TTLCache
 
 admin_router = Router()
 admin_router.message.filter(ChatTypeFilter(["private"]), IsAdmin())
@@ -38,8 +47,10 @@ async def admin_features(message: types.Message, i18n: TranslatorRunner) -> None
 
 
 @admin_router.message(TranslatedText("admin_assortment"))
-async def assortment_text(message: types.Message, i18n: TranslatorRunner):
-    categories = await get_categories()
+async def assortment_text(
+    message: types.Message, i18n: TranslatorRunner, user_language: str
+):
+    categories = await get_categories(user_language)
     btns = {category.name: f"category_{category.id}" for category in categories}
     await message.answer(
         i18n.admin_choose_category(), reply_markup=get_callback_btns(btns=btns)
@@ -47,16 +58,21 @@ async def assortment_text(message: types.Message, i18n: TranslatorRunner):
 
 
 @admin_router.message(TranslatedText("admin_statistics"))
-async def show_statistics(message: types.Message, i18n: TranslatorRunner):
+async def show_statistics(
+    message: types.Message, i18n: TranslatorRunner, user_language: str
+):
     users = await total_users()
     orders = await total_orders()
     products = await total_products()
-    category_stats = await total_products_by_category()
+    category_stats = await total_products_by_category(user_language)
 
     category_stats_lines = [
         f"{category}: {count}" for category, count in category_stats.items()
     ]
     category_stats_text = textwrap.indent("\n".join(category_stats_lines), "        ")
+    cache_stats_lines = [cache.stats_line() for cache in TTLCache.instances.values()]
+    cache_stats_text = textwrap.indent("\n".join(cache_stats_lines), "        ")
+    db_pool_stats_text = await ConnectionPool.stats_line()
 
     await message.answer(
         i18n.admin_statistics_text(
@@ -64,15 +80,19 @@ async def show_statistics(message: types.Message, i18n: TranslatorRunner):
             orders=orders,
             products=products,
             category_stats_text=category_stats_text,
+            cache_stats_text=cache_stats_text,
+            db_pool_stats_text=db_pool_stats_text,
         )
     )
 
 
 @admin_router.callback_query(F.data.startswith("category_"))
-async def starring_at_product(callback: types.CallbackQuery, i18n: TranslatorRunner):
+async def starring_at_product(
+    callback: types.CallbackQuery, i18n: TranslatorRunner, user_language: str
+):
     try:
         category_id = callback.data.split("_")[-1]
-        products = await get_products(int(category_id))
+        products = await get_products(int(category_id), user_language)
 
         for product in products:
             try:
@@ -91,12 +111,13 @@ async def starring_at_product(callback: types.CallbackQuery, i18n: TranslatorRun
                 if product.image and hasattr(product.image, "path"):
                     image_path = product.image.path
                     if os.path.exists(image_path):
-                        photo = FSInputFile(image_path)
-                        await callback.message.answer_photo(
+                        photo = await MediaCache.get_photo(image_path)
+                        sent = await callback.message.answer_photo(
                             photo=photo,
                             caption=caption,
                             reply_markup=reply_markup,
                         )
+                        await MediaCache.remember(photo, sent)
                 else:
                     await callback.message.answer(
                         caption,
@@ -117,6 +138,7 @@ async def starring_at_product(callback: types.CallbackQuery, i18n: TranslatorRun
 async def get_delete_product(callback: types.CallbackQuery, i18n: TranslatorRunner):
     product_id = callback.data.split("_")[-1]
     await delete_product(int(product_id))
+    await CatalogSnapshot.refresh_product(int(product_id))
 
     animation_url: str = os.getenv("DELETE_ANIMATION_URL")
     if animation_url:
@@ -151,6 +173,7 @@ async def add_banner(message: types.Message, state: FSMContext, i18n: Translator
         save_path = await download_telegram_photo(message, "banners", for_page)
 
         await change_banner_image(for_page, save_path)
+        await MediaCache.invalidate(os.path.join(settings.MEDIA_ROOT, save_path))
 
         await message.answer(i18n.admin_banner_success())
 
@@ -284,7 +307,9 @@ async def not_correct_add_en_description(message: types.Message, i18n: Translato
 
 
 @admin_router.message(AddProduct.ru_description, F.text)
-async def add_ru_description(message: types.Message, state: FSMContext, i18n: TranslatorRunner):
+async def add_ru_description(
+    message: types.Message, state: FSMContext, i18n: TranslatorRunner, user_language: str
+):
     if message.text == "." and AddProduct.product_for_change:
         await state.update_data(ru_description=AddProduct.product_for_change.description_ru)
     else:
@@ -293,7 +318,7 @@ async def add_ru_description(message: types.Message, state: FSMContext, i18n: Tr
             return
         await state.update_data(ru_description=message.text)
 
-    categories = await get_categories()
+    categories = await get_categories(user_language)
     btns = {category.name: str(category.id) for category in categories}
     await message.answer(i18n.admin_choose_category(), reply_markup=get_callback_btns(btns=btns))
     await state.set_state(AddProduct.category)
@@ -364,9 +389,14 @@ async def add_image(message: types.Message, state: FSMContext, i18n: TranslatorR
                 old_image_path = AddProduct.product_for_change.image.path
                 if os.path.exists(old_image_path):
                     os.remove(old_image_path)
+                await MediaCache.invalidate(old_image_path)
             await update_product(AddProduct.product_for_change.id, data)
+            await CatalogSnapshot.refresh_product(
+                AddProduct.product_for_change.id, int(data["category"])
+            )
         else:
             await add_product(data)
+            await CatalogSnapshot.refresh_categories(int(data["category"]))
 
         admin_kb = get_admin_keyboard(i18n)
         await message.answer(i18n.admin_product_success(), reply_markup=admin_kb)
@@ -392,35 +422,78 @@ async def newsletter(message: types.Message, state: FSMContext, i18n: Translator
         return
 
     await state.set_state(Newsletter.waiting_for_content)
-    await message.answer(i18n.admin_newsletter_content())
+    await state.update_data(newsletter_step=0, newsletter_variants={})
+    await ask_newsletter_variant(message, i18n, 0)
+
+
+async def ask_newsletter_variant(
+    message: types.Message, i18n: TranslatorRunner, step: int
+):
+    language = LANGUAGE[step][1]
+    if step == 0:
+        await message.answer(i18n.admin_newsletter_content(language=language))
+    else:
+        await message.answer(i18n.admin_newsletter_content_optional(language=language))
+
+
+newsletter_albums: dict[str, list[int]] = {}
 
 
 @admin_router.message(Newsletter.waiting_for_content)
 async def process_newsletter(
     message: types.Message, state: FSMContext, i18n: TranslatorRunner
 ):
-    users = TelegramUser.objects.all()
-    start_time = datetime.now()
-    success_count = 0
-    error_count = 0
-    for user in users:
-        try:
-            await bot.send_message(
-                user.user_id, message.text, parse_mode=message.parse_mode
+    if message.media_group_id:
+        data = await state.get_data()
+        groups = data.get("newsletter_groups", {})
+        language_code = groups.get(message.media_group_id)
+        if language_code is not None:
+            # A part that arrived after its album was already saved.
+            variants = data["newsletter_variants"]
+            variants[language_code] = sorted(
+                [*variants[language_code], message.message_id]
             )
-            success_count += 1
-        except Exception:
-            error_count += 1
-            continue
+            await state.update_data(newsletter_variants=variants)
+            return
 
-    time_taken = (datetime.now() - start_time).total_seconds()
-    await message.answer(
-        i18n.admin_newsletter_success(
-            success_count=success_count,
-            error_count=error_count,
-            time_taken=f"{time_taken:.2f}",
-        ),
-        parse_mode="HTML",
-    )
+        album = newsletter_albums.setdefault(message.media_group_id, [])
+        album.append(message.message_id)
+        if len(album) > 1:
+            return
+
+        received = 0
+        while received != len(album):
+            received = len(album)
+            await asyncio.sleep(env_config.BROADCAST_ALBUM_DELAY)
+        message_ids = sorted(newsletter_albums.pop(message.media_group_id))
+    else:
+        message_ids = [message.message_id]
+
+    data = await state.get_data()
+    step = data["newsletter_step"]
+    variants = data["newsletter_variants"]
+    groups = data.get("newsletter_groups", {})
+
+    if message.text == ".":
+        if step == 0:
+            await ask_newsletter_variant(message, i18n, step)
+            return
+    else:
+        variants[LANGUAGE[step][0]] = message_ids
+        if message.media_group_id:
+            groups[message.media_group_id] = LANGUAGE[step][0]
+
+    step += 1
+    if step < len(LANGUAGE):
+        await state.update_data(
+            newsletter_step=step,
+            newsletter_variants=variants,
+            newsletter_groups=groups,
+        )
+        await ask_newsletter_variant(message, i18n, step)
+        return
+
+    broadcast = await create_broadcast(message.from_user.id, variants)
+    Broadcaster.start(bot, broadcast, i18n)
 
     await state.clear()
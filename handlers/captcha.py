@@ -1,14 +1,11 @@
 import random
-from datetime import timedelta
 from typing import Any
 
-from aiogram import Router, types
+from aiogram import F, Router, types
 from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import (CallbackQuery, InlineKeyboardButton,
                            InlineKeyboardMarkup, Message, ReplyKeyboardRemove)
-from asgiref.sync import sync_to_async
-from django.utils import timezone
 from fluentogram import TranslatorRunner
 
 from app import CHANNEL_LINK
@@ -16,7 +13,7 @@ from django_project.telegrambot.usersmanage.models import CaptchaRecord
 from filters.chat_types import ChatTypeFilter
 from handlers.check_subscription import CheckSubscription
 from handlers.start_cmd import start_cmd
-from queries.captcha_queries import mark_captcha_passed
+from queries.captcha_queries import has_passed_captcha, mark_captcha_passed
 from queries.user_queries import get_user
 from states.registration_state import RegistrationStates
 
@@ -42,19 +39,7 @@ user_captcha_data: dict[int, dict[str, Any]] = {}
 class CaptchaManager:
     @staticmethod
     async def has_passed_recently(user_id: int) -> bool:
-        try:
-            time_expiration = timezone.now() - timedelta(weeks=2)
-            user = await get_user(user_id)
-            if not user:
-                return False
-
-            return await sync_to_async(
-                CaptchaRecord.objects.filter(
-                    user=user, timestamp__gt=time_expiration
-                ).exists
-            )()
-        except CaptchaRecord.DoesNotExist:
-            return False
+        return await has_passed_captcha(user_id)
 
     @staticmethod
     def generate_captcha() -> tuple[str, str, InlineKeyboardMarkup]:
@@ -190,7 +175,7 @@ async def captcha_cmd(message: types.Message, i18n: TranslatorRunner):
         await CaptchaManager.send_new_captcha(message, user_id, i18n)
 
 
-@captcha_router.callback_query(lambda c: c.data in EMOJI_LIST)
+@captcha_router.callback_query(F.data.in_(EMOJI_LIST))
 async def process_captcha_callback(
     callback: types.CallbackQuery, state: FSMContext, i18n: TranslatorRunner
 ):
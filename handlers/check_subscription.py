@@ -1,35 +1,93 @@
+import asyncio
+
 from aiogram import F, Router
 from aiogram.exceptions import TelegramBadRequest
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, ChatMemberUpdated
 from fluentogram import TranslatorRunner
 
 from app import CHANNEL_ID, bot
+from app_config import env_config
 from handlers.menu_processing import get_menu_content
+from utils.media_cache import MediaCache
+from utils.ttl_cache import TTLCache
 
 subscription_router = Router()
 
+SUBSCRIBED_STATUSES: tuple[str, ...] = ("creator", "administrator", "member")
+
+subscription_cache = TTLCache(
+    "subscription",
+    maxsize=env_config.SUBSCRIPTION_CACHE_SIZE,
+    ttl=env_config.SUBSCRIPTION_POSITIVE_TTL,
+)
+
 
 class CheckSubscription:
+    _pending: dict[int, asyncio.Task] = {}
+
     @staticmethod
-    async def check_member_subscription(user_id: int) -> bool:
+    async def _fetch_member_subscription(user_id: int) -> bool:
         try:
             member = await bot.get_chat_member(chat_id=CHANNEL_ID, user_id=user_id)
-            return member.status in ["creator", "administrator", "member"]
+            return member.status in SUBSCRIBED_STATUSES
         except TelegramBadRequest:
             return False
 
+    @staticmethod
+    def remember(user_id: int, is_member: bool) -> None:
+        ttl = (
+            env_config.SUBSCRIPTION_POSITIVE_TTL
+            if is_member
+            else env_config.SUBSCRIPTION_NEGATIVE_TTL
+        )
+        subscription_cache.set(user_id, is_member, ttl=ttl)
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        subscription_cache.delete(user_id)
+
+    @classmethod
+    async def check_member_subscription(cls, user_id: int) -> bool:
+        is_member = subscription_cache.get(user_id)
+        if is_member is not None:
+            return is_member
+
+        task = cls._pending.get(user_id)
+        if task is None:
+            task = asyncio.create_task(cls._fetch_member_subscription(user_id))
+            task.add_done_callback(lambda _: cls._pending.pop(user_id, None))
+            cls._pending[user_id] = task
+
+        is_member = await asyncio.shield(task)
+        cls.remember(user_id, is_member)
+        return is_member
+
+
+def is_subscription_channel(event: ChatMemberUpdated) -> bool:
+    if str(event.chat.id) == CHANNEL_ID:
+        return True
+    return bool(event.chat.username) and f"@{event.chat.username}" == CHANNEL_ID
+
+
+@subscription_router.chat_member(is_subscription_channel)
+async def channel_member_updated(event: ChatMemberUpdated):
+    member = event.new_chat_member
+    CheckSubscription.remember(member.user.id, member.status in SUBSCRIBED_STATUSES)
+
 
 @subscription_router.callback_query(F.data == "check_subscription")
 async def check_subscription_callback(callback: CallbackQuery, i18n: TranslatorRunner):
     user_id = callback.from_user.id
 
+    CheckSubscription.invalidate(user_id)
     if await CheckSubscription.check_member_subscription(user_id):
         media, reply_markup = await get_menu_content(
             level=0, menu_name="main", i18n=i18n
         )
-        await callback.message.answer_photo(
+        sent = await callback.message.answer_photo(
             media.media, caption=media.caption, reply_markup=reply_markup
         )
+        await MediaCache.remember(media.media, sent)
         await callback.message.delete()
         await callback.answer(i18n.subscription_successful())
     else:
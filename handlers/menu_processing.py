@@ -1,20 +1,19 @@
 import os
 from typing import Any
 
-from aiogram.types import FSInputFile, InputMediaPhoto
+from aiogram.types import InputMediaPhoto
 from django.conf import settings
 from fluentogram import TranslatorRunner
-from parler.utils.context import switch_language
 
 from keybords.inline import (get_products_btns, get_user_cart,
                              get_user_catalog_btns, get_user_main_btns)
 from queries.cart_queries import (add_to_cart, delete_from_cart,
-                                  get_user_carts, reduce_product_in_cart)
-from queries.category_queries import get_categories
-from queries.products_queries import get_products
+                                  get_user_cart_page, reduce_product_in_cart)
+from utils.catalog import CatalogSnapshot
 from utils.get_banner_image import get_banner_image
+from utils.media_cache import MediaCache
 from utils.paginator import Paginator
-from utils.currency import  convert_currency, format_price
+from utils.currency import convert_currencies, convert_currency, format_price
 
 
 async def main_menu(level: int, menu_name: str, i18n: TranslatorRunner) -> tuple:
@@ -25,13 +24,12 @@ async def main_menu(level: int, menu_name: str, i18n: TranslatorRunner) -> tuple
 
 async def catalog(level: int, menu_name: str, i18n: Any, user_language: str) -> tuple:
     image = await get_banner_image(menu_name, i18n)
-    categories = await get_categories()
+    categories = await CatalogSnapshot.get_categories(user_language)
 
     kbds = get_user_catalog_btns(
         level=level,
         categories=categories,
         i18n=i18n,
-        user_language=user_language,
     )
     return image, kbds
 
@@ -50,28 +48,27 @@ async def pages(paginator: Paginator, i18n: TranslatorRunner) -> dict:
 async def products(
     level: int, category: int, page: int, i18n: TranslatorRunner, user_language: str
 ) -> tuple:
-    products = await get_products(category_id=category)
+    products = await CatalogSnapshot.get_products(category, user_language)
 
     paginator = Paginator(products, page)
     product = paginator.get_page()[0]
-    with switch_language(product, user_language):
-        converted_price, current_symbol = await convert_currency(
-            product.price, user_language
+    converted_price, current_symbol = await convert_currency(
+        product.price, user_language
+    )
+    formatted_price = format_price(converted_price, current_symbol)
+    if product.image_path:
+        image = InputMediaPhoto(
+            media=await MediaCache.get_photo(product.image_path),
+            caption=i18n.product_details(
+                name=product.name,
+                description=product.description,
+                price=formatted_price,
+                current_page=paginator.page,
+                total_pages=paginator.pages,
+            ),
         )
-        formatted_price = format_price(converted_price, current_symbol)
-        if product.image:
-            image = InputMediaPhoto(
-                media=FSInputFile(product.image.path),
-                caption=i18n.product_details(
-                    name=product.name,
-                    description=product.description,
-                    price=formatted_price,
-                    current_page=paginator.page,
-                    total_pages=paginator.pages,
-                ),
-            )
-        else:
-            raise ValueError(i18n.product_no_image())
+    else:
+        raise ValueError(i18n.product_no_image())
 
     pagination_btns = await pages(paginator, i18n=i18n)
 
@@ -108,37 +105,35 @@ async def carts(
     elif menu_name == "increment":
         await add_to_cart(user_id, product_id)
 
-    carts = await get_user_carts(user_id)
+    paginator, page_carts, total_price_usd = await get_user_cart_page(
+        user_id, page, user_language
+    )
 
-    if not carts:
+    if not page_carts:
         image = await get_banner_image("cart", i18n)
         kbds = get_user_cart(
             level=level, i18n=i18n, page=None, pagination_btns=None, product_id=None
         )
 
     else:
-        paginator = Paginator(carts, page=page)
-        cart = paginator.get_page()[0]
+        cart = page_carts[0]
+        page = paginator.page
 
-        converted_product_price, currency_symbol = await convert_currency(
-            cart.product.price, user_language
+        (product_price, cart_price, total_price), _, currency_symbol = (
+            await convert_currencies(
+                [cart.product.price, cart.product.price * cart.quantity, total_price_usd],
+                user_language,
+            )
         )
-        formatted_product_price = format_price(converted_product_price, currency_symbol)
-
-        cart_price = cart.quantity * converted_product_price
+        formatted_product_price = format_price(product_price, currency_symbol)
         formatted_cart_price = format_price(cart_price, currency_symbol)
-
-        total_price = 0
-        for c in carts:
-            converted_price, _ = await convert_currency(c.product.price, user_language)
-            total_price += c.quantity * converted_price
         formatted_total_price = format_price(total_price, currency_symbol)
 
         if cart.product.image:
             image_path = os.path.join(settings.MEDIA_ROOT, str(cart.product.image))
             if os.path.exists(image_path):
                 image = InputMediaPhoto(
-                    media=FSInputFile(image_path),
+                    media=await MediaCache.get_photo(image_path),
                     caption=i18n.cart_item_details(
                         name=cart.product.name,
                         price=formatted_product_price,
@@ -1,17 +1,19 @@
-import asyncio
 import os
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Union
 
 from aiogram import F, Router, types
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
 from aiogram.types import (CallbackQuery, InlineKeyboardButton,
                            InlineKeyboardMarkup, KeyboardButton, LabeledPrice,
                            Message, ReplyKeyboardMarkup, ReplyKeyboardRemove)
-from fluentogram import TranslatorRunner
+from django.utils import timezone
+from fluentogram import TranslatorHub, TranslatorRunner
 
-from app import crypto_client
+from app_config import env_config
 from callbacks.callbacks import OrderDetailCallBack
 from filters.chat_types import ChatTypeFilter
 from handlers.payment import CryptoApiManager
@@ -19,13 +21,20 @@ from keybords.inline import (MenuCallBack, get_order_details_keyboard,
                              get_select_payment_keyboard, get_user_main_btns)
 from keybords.reply import get_back_button
 from queries.banner_queries import get_banner
-from queries.cart_queries import clear_cart, get_cart_items
-from queries.order_queries import (add_order_with_items, get_order_by_id,
-                                   get_order_items, get_order_status,
+from queries.cart_queries import get_cart_items
+from queries.order_queries import (get_order_by_id, get_order_items,
                                    get_user_orders)
+from queries.payment_queries import (complete_pending_payment,
+                                     create_pending_payment,
+                                     discard_pending_payment,
+                                     get_pending_payments)
 from states.order_state import OrderState
+from utils.crypto_client import get_crypto_client
+from utils.currency import (convert_currencies, convert_currency,
+                            format_price)
 from utils.get_banner_image import get_banner_image
-from utils.currency import convert_currency, format_price
+from utils.media_cache import MediaCache
+from utils.payment_watcher import PaymentWatcher
 from utils.phone_formatting import format_phone_number
 
 order_router = Router()
@@ -105,7 +114,9 @@ async def process_address(
         float(item.product.price) * item.quantity for item in cart_items
     )
 
-    total_amount, currency = await convert_currency(total_amount_usd, user_language)
+    _, total_amount, currency = await convert_currencies(
+        [item.product.price * item.quantity for item in cart_items], user_language
+    )
 
     confirmation_message = i18n.order_confirmation(
         name=user_data["name"],
@@ -153,6 +164,7 @@ async def process_crypto_payment(
     callback: CallbackQuery,
     state: FSMContext,
     i18n: TranslatorRunner,
+    translator_hub: TranslatorHub,
     user_language: str,
 ):
     try:
@@ -175,7 +187,7 @@ async def process_crypto_payment(
                 await callback.answer(i18n.crypto_calculation_error(), show_alert=True)
                 return
 
-            invoice = await crypto_client.create_invoice(
+            invoice = await get_crypto_client().create_invoice(
                 asset=crypto,
                 amount=crypto_amount,
                 description=i18n.order_payment_description(
@@ -194,7 +206,9 @@ async def process_crypto_payment(
             await callback.answer(i18n.invalid_payment_response(), show_alert=True)
             return
 
-        expiration_time = datetime.now() + timedelta(minutes=3)
+        expiration_time = datetime.now() + timedelta(
+            seconds=env_config.PAYMENT_TIMEOUT
+        )
 
         try:
             await state.update_data(
@@ -204,6 +218,17 @@ async def process_crypto_payment(
                     "expiration_time": expiration_time.timestamp(),
                 }
             )
+            await create_pending_payment(
+                invoice_id=invoice.invoice_id,
+                user_id=callback.from_user.id,
+                crypto=crypto,
+                amount=amount_usd,
+                language=user_language,
+                name=user_data["name"],
+                phone=user_data["phone"],
+                address=user_data["address"],
+                timeout=env_config.PAYMENT_TIMEOUT,
+            )
         except Exception:
             await callback.answer(i18n.payment_data_save_error(), show_alert=True)
             return
@@ -246,18 +271,14 @@ async def process_crypto_payment(
             await callback.answer(i18n.payment_details_display_error(), show_alert=True)
             return
 
-        asyncio.create_task(
-            check_payment(
-                invoice.invoice_id,
-                callback.from_user.id,
-                amount_usd,
-                crypto,
-                callback.bot,
-                state,
-                user_data,
-                i18n,
-                user_language,
-            )
+        watch_crypto_payment(
+            callback.bot,
+            state.storage,
+            translator_hub,
+            invoice.invoice_id,
+            callback.from_user.id,
+            user_language,
+            timeout=env_config.PAYMENT_TIMEOUT,
         )
 
     except Exception:
@@ -313,80 +334,111 @@ async def handle_star_payment(
         await callback.answer(i18n.star_payment_error(), show_alert=True)
 
 
-async def check_payment(
-    invoice_id,
-    user_id,
-    amount,
-    crypto,
+async def clear_user_state(bot, storage: BaseStorage, user_id: int) -> None:
+    await FSMContext(storage=storage, key=StorageKey(bot.id, user_id, user_id)).clear()
+
+
+async def complete_crypto_payment(
     bot,
-    state,
-    user_data,
-    i18n: TranslatorRunner,
-    user_language: str,
+    storage: BaseStorage,
+    translator_hub: TranslatorHub,
+    invoice_id: int,
+    user_id: int,
+    language: str,
 ):
-    expiration_time = datetime.now() + timedelta(minutes=3)
+    i18n = translator_hub.get_translator_by_locale(language)
+    try:
+        completed = await complete_pending_payment(invoice_id)
+        if completed is None:
+            return
+        payment, order = completed
 
-    while datetime.now() < expiration_time:
-        try:
-            invoices = await crypto_client.get_invoices(invoice_ids=[invoice_id])
-            if invoices and invoices[0].status == "paid":
-                try:
-                    cart_items = await get_cart_items(user_id)
-                    order = await add_order_with_items(
-                        user_id=user_id,
-                        name=user_data["name"],
-                        phone=user_data["phone"],
-                        address=user_data["address"],
-                        status="completed",
-                        cart_items=cart_items,
-                    )
-                    await clear_cart(user_id)
-                    order_status = await get_order_status(order.id)
+        display_amount, currency = await convert_currency(
+            float(payment.amount), language
+        )
 
-                    display_amount, currency = await convert_currency(
-                        float(amount), user_language
-                    )
+        success_message = i18n.payment_successful(
+            order_id=str(order.id),
+            order_status=order.status,
+            amount=format_price(display_amount, currency),
+            crypto=payment.crypto,
+            name=payment.name,
+            phone=str(payment.phone),
+            address=payment.address,
+        )
 
-                    success_message = i18n.payment_successful(
-                        order_id=str(order.id),
-                        order_status=order_status,
-                        amount=format_price(display_amount, currency),
-                        crypto=crypto,
-                        name=user_data["name"],
-                        phone=user_data["phone"],
-                        address=user_data["address"],
-                    )
+        main_menu_keyboard = get_user_main_btns(level=1, i18n=i18n)
 
-                    main_menu_keyboard = get_user_main_btns(level=1, i18n=i18n)
+        temp_msg = await bot.send_message(
+            user_id, "...", reply_markup=ReplyKeyboardRemove()
+        )
+        await bot.delete_message(user_id, temp_msg.message_id)
 
-                    temp_msg = await bot.send_message(
-                        user_id, "...", reply_markup=ReplyKeyboardRemove()
-                    )
-                    await bot.delete_message(user_id, temp_msg.message_id)
+        await bot.send_message(
+            user_id,
+            success_message,
+            reply_markup=main_menu_keyboard,
+            parse_mode="HTML",
+        )
 
-                    await bot.send_message(
-                        user_id,
-                        success_message,
-                        reply_markup=main_menu_keyboard,
-                        parse_mode="HTML",
-                    )
+        await clear_user_state(bot, storage, user_id)
 
-                    await state.clear()
-                    return
+    except Exception:
+        await bot.send_message(
+            user_id, i18n.payment_received_order_failed(), parse_mode="HTML"
+        )
 
-                except Exception:
-                    await bot.send_message(
-                        user_id, i18n.payment_received_order_failed(), parse_mode="HTML"
-                    )
-                    return
 
-            await asyncio.sleep(5)
-        except Exception:
-            await asyncio.sleep(5)
-            continue
+async def expire_crypto_payment(
+    bot,
+    storage: BaseStorage,
+    translator_hub: TranslatorHub,
+    invoice_id: int,
+    user_id: int,
+    language: str,
+):
+    if await discard_pending_payment(invoice_id) is None:
+        return
 
+    i18n = translator_hub.get_translator_by_locale(language)
     await bot.send_message(user_id, i18n.payment_time_expired(), parse_mode="HTML")
-    await state.clear()
+    await clear_user_state(bot, storage, user_id)
+
+
+def watch_crypto_payment(
+    bot,
+    storage: BaseStorage,
+    translator_hub: TranslatorHub,
+    invoice_id: int,
+    user_id: int,
+    language: str,
+    timeout: float,
+):
+    args = (bot, storage, translator_hub, invoice_id, user_id, language)
+    PaymentWatcher.watch(
+        invoice_id,
+        on_paid=partial(complete_crypto_payment, *args),
+        on_expired=partial(expire_crypto_payment, *args),
+        timeout=timeout,
+    )
+
+
+async def resume_crypto_payments(
+    bot, storage: BaseStorage, translator_hub: TranslatorHub
+):
+    now = timezone.now()
+    for payment in await get_pending_payments():
+        watch_crypto_payment(
+            bot,
+            storage,
+            translator_hub,
+            payment.invoice_id,
+            payment.user.user_id,
+            payment.language,
+            timeout=(payment.expires_at - now).total_seconds(),
+        )
+
+    await PaymentWatcher.poll()
 
 
 @order_router.callback_query(F.data == "cancel_order")
@@ -485,7 +537,7 @@ async def process_orders_command(
             return
 
         media = types.InputMediaPhoto(
-            media=types.FSInputFile(path=banner.image.path),
+            media=await MediaCache.get_photo(banner.image.path),
             caption=final_caption,
             parse_mode="HTML",
         )
@@ -493,15 +545,17 @@ async def process_orders_command(
         keyboard = get_order_details_keyboard(orders, i18n)
 
         if isinstance(update, CallbackQuery):
-            await target.edit_media(media=media, reply_markup=keyboard)
+            sent = await target.edit_media(media=media, reply_markup=keyboard)
+            await MediaCache.remember(media.media, sent)
             await update.answer()
         else:
-            await target.answer_photo(
+            sent = await target.answer_photo(
                 photo=media.media,
                 caption=media.caption,
                 reply_markup=keyboard,
                 parse_mode="HTML",
             )
+            await MediaCache.remember(media.media, sent)
     except Exception:
         error_message = i18n.order_details_error()
         if isinstance(update, CallbackQuery):
@@ -523,33 +577,32 @@ async def process_order_detail(
             await callback.answer(i18n.order_not_found(), show_alert=True)
             return
 
-        items = await get_order_items(order.id)
+        items = await get_order_items(order.id, user_language)
         if not items:
             await callback.answer(i18n.order_no_products(), show_alert=True)
             return
 
-        total_sum_usd = sum(float(item.price) * item.quantity for item in items)
-        total_sum, currency = await convert_currency(total_sum_usd, user_language)
-
-        item_details_list = []
-        for item in items:
-            item_price_usd = float(item.price)
-            item_price, item_currency = await convert_currency(
-                item_price_usd, user_language
-            )
+        item_prices, _, currency = await convert_currencies(
+            [item.price for item in items], user_language
+        )
+        total_sum = sum(
+            price * item.quantity for price, item in zip(item_prices, items)
+        )
 
-            item_details_list.append(
-                i18n.order_detail_item(
-                    name=item.product.name,
-                    quantity=int(item.quantity),
-                    price=format_price(item_price, item_currency),
-                )
+        item_details_list = [
+            i18n.order_detail_item(
+                name=item.product.name,
+                quantity=int(item.quantity),
+                price=format_price(item_price, currency),
             )
+            for item, item_price in zip(items, item_prices)
+        ]
+        item_details_text = "\n".join(item_details_list)
 
         final_text = (
             f"{i18n.order_detail_header(order_id=str(order.id)[:8], created_at=order.created_at.strftime('%d.%m.%Y %H:%M'), name=order.name, status=order.status, address=order.address, phone=str(order.phone))}"
             f"\n\n"
-            f"{'\n'.join(item_details_list)}"
+            f"{item_details_text}"
             f"\n\n"
             f"{i18n.order_detail_total(total_sum=format_price(total_sum, currency))}"
         )
@@ -568,7 +621,8 @@ async def process_order_detail(
         try:
             media = await get_banner_image("orders", i18n)
             media.caption = final_text
-            await callback.message.edit_media(media=media, reply_markup=keyboard)
+            sent = await callback.message.edit_media(media=media, reply_markup=keyboard)
+            await MediaCache.remember(media.media, sent)
         except (ValueError, FileNotFoundError):
             await callback.message.edit_text(
                 text=final_text, parse_mode="HTML", reply_markup=keyboard
@@ -1,37 +1,87 @@
+import asyncio
 import os
+import time
 from http import HTTPStatus
 from typing import Union
 
 import aiohttp
 
+from app_config import env_config
+from utils.ttl_cache import TTLCache
+
+rate_cache = TTLCache("rates", maxsize=64, ttl=env_config.RATE_STALE_TTL)
+
 
 class CryptoApiManager:
     RATE_API_URL: str = os.getenv("RATE_API_URL")
     REQUEST_TIMEOUT: int = 10
+    RATE_CACHE_TTL: int = env_config.RATE_CACHE_TTL
+
+    _session: Union[aiohttp.ClientSession, None] = None
+    _pending: dict[tuple[str, str], asyncio.Task] = {}
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=cls.REQUEST_TIMEOUT)
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
 
     @classmethod
     async def _make_request(cls, url: str) -> Union[dict, None]:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=cls.REQUEST_TIMEOUT) as response:
-                    if response.status == HTTPStatus.OK:
-                        return await response.json()
-                    else:
-                        return None
-        except (ConnectionError, aiohttp.ClientError):
+            async with cls._get_session().get(url) as response:
+                if response.status == HTTPStatus.OK:
+                    return await response.json()
+                else:
+                    return None
+        except (ConnectionError, aiohttp.ClientError, asyncio.TimeoutError):
             return None
 
     @classmethod
-    async def get_crypto_rate(
-        cls, crypto: str, fiat: str = "USD"
-    ) -> Union[float, None]:
-        url: str = f"{cls.RATE_API_URL}?fsym={crypto}&tsyms={fiat}"
+    async def _fetch_rate(cls, fsym: str, tsym: str) -> Union[float, None]:
+        url: str = f"{cls.RATE_API_URL}?fsym={fsym}&tsyms={tsym}"
         data = await cls._make_request(url)
 
-        if data and (rate := data.get(fiat)) is not None:
+        if data and (rate := data.get(tsym)) is not None:
+            rate_cache.set((fsym, tsym), (time.monotonic(), float(rate)))
             return float(rate)
         return None
 
+    @classmethod
+    def _refresh_rate(cls, fsym: str, tsym: str) -> asyncio.Task:
+        key = (fsym, tsym)
+        task = cls._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(cls._fetch_rate(fsym, tsym))
+            task.add_done_callback(lambda _: cls._pending.pop(key, None))
+            cls._pending[key] = task
+        return task
+
+    @classmethod
+    async def get_rate(cls, fsym: str, tsym: str) -> Union[float, None]:
+        cached = rate_cache.get((fsym, tsym))
+        if cached is not None:
+            fetched_at, rate = cached
+            if time.monotonic() - fetched_at >= cls.RATE_CACHE_TTL:
+                cls._refresh_rate(fsym, tsym)
+            return rate
+
+        return await asyncio.shield(cls._refresh_rate(fsym, tsym))
+
+    @classmethod
+    async def get_crypto_rate(
+        cls, crypto: str, fiat: str = "USD"
+    ) -> Union[float, None]:
+        return await cls.get_rate(crypto, fiat)
+
     @classmethod
     async def convert_to_crypto(
         cls, amount: float, fiat: str, crypto: str
@@ -44,8 +94,4 @@ class CryptoApiManager:
 
     @classmethod
     async def get_usd_to_rub_rate(cls) -> Union[float, None]:
-        url = f"{cls.RATE_API_URL}?fsym=USD&tsyms=RUB"
-        data = await cls._make_request(url)
-        if data and (rate := data.get("RUB")) is not None:
-            return float(rate)
-        return None
+        return await cls.get_rate("USD", "RUB")
@@ -21,6 +21,7 @@ from queries.order_queries import get_user_orders
 from queries.user_queries import create_telegram_user, get_user
 from states.registration_state import RegistrationStates
 from utils.get_banner_image import get_banner_image
+from utils.media_cache import MediaCache
 from utils.phone_formatting import format_phone_number
 
 
@@ -178,13 +179,15 @@ async def process_profile_command(
 
         if isinstance(update, CallbackQuery):
             keyboard = get_inline_back_button(i18n=i18n)
-            await target.edit_media(media=media, reply_markup=keyboard)
+            sent = await target.edit_media(media=media, reply_markup=keyboard)
+            await MediaCache.remember(media.media, sent)
             await update.answer()
         else:
             keyboard = get_back_button(i18n=i18n)
-            await target.answer_photo(
+            sent = await target.answer_photo(
                 photo=media.media, caption=media.caption, reply_markup=keyboard
             )
+            await MediaCache.remember(media.media, sent)
 
     except (ValueError, FileNotFoundError, AttributeError, OSError, TypeError) as e:
         error_message = str(e) or i18n.profile_load_error()
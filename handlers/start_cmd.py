@@ -2,6 +2,7 @@ from aiogram import types
 from fluentogram import TranslatorRunner
 
 from handlers.menu_processing import get_menu_content
+from utils.media_cache import MediaCache
 
 
 async def start_cmd(message: types.Message, i18n: TranslatorRunner) -> None:
@@ -10,6 +11,7 @@ async def start_cmd(message: types.Message, i18n: TranslatorRunner) -> None:
         menu_name="main",
         i18n=i18n,
     )
-    await message.answer_photo(
+    sent = await message.answer_photo(
         media.media, caption=media.caption, reply_markup=reply_markup
     )
+    await MediaCache.remember(media.media, sent)
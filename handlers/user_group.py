@@ -6,14 +6,12 @@ from aiogram.filters import Command
 from fluentogram import TranslatorRunner
 
 from filters.chat_types import ChatTypeFilter
-from utils.text_processing import clean_text, get_restricted_words
+from utils.restricted_words import RestrictedWords
 
 user_group_router = Router()
 user_group_router.message.filter(ChatTypeFilter(["group", "supergroup"]))
 user_group_router.edited_message.filter(ChatTypeFilter(["group", "supergroup"]))
 
-restricted_words: set[str] = get_restricted_words()
-
 
 @user_group_router.message(Command("admin"))
 async def get_admins(message: types.Message, bot: Bot) -> None:
@@ -75,7 +73,8 @@ async def clear_group(message: types.Message, bot: Bot, i18n: TranslatorRunner)
 @user_group_router.edited_message()
 @user_group_router.message()
 async def cleaner(message: types.Message, i18n: TranslatorRunner) -> None:
-    if restricted_words.intersection(clean_text(message.text.lower()).split()):
+    text = message.text or message.caption
+    if text and RestrictedWords.find(text):
         first_name = message.from_user.first_name or ""
         last_name = message.from_user.last_name or ""
         full_name = f"{first_name} {last_name}"
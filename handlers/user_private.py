@@ -8,12 +8,14 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 from fluentogram import TranslatorRunner
 
+from callbacks.menu_codec import MenuData
 from filters.chat_types import ChatTypeFilter
 from handlers.captcha import CaptchaManager
 from handlers.menu_processing import get_menu_content
 from keybords.inline import MenuCallBack
 from queries.banner_queries import get_banner
 from queries.cart_queries import add_to_cart
+from utils.media_cache import MediaCache
 
 user_private_router = Router()
 user_private_router.message.filter(ChatTypeFilter(["private"]))
@@ -28,6 +30,7 @@ async def process_menu_command(
     state: FSMContext,
     i18n: TranslatorRunner,
     user_language: str,
+    callback_data: MenuData | None = None,
 ) -> None:
     try:
         user_id = update.from_user.id
@@ -42,8 +45,7 @@ async def process_menu_command(
             return
 
         if isinstance(update, CallbackQuery):
-            if "add_to_cart" in update.data:
-                callback_data = MenuCallBack.unpack(update.data)
+            if callback_data.menu_name == "add_to_cart":
                 cart_item = await add_to_cart(
                     user_id=user_id, product_id=callback_data.product_id
                 )
@@ -55,7 +57,6 @@ async def process_menu_command(
                 return
 
         if isinstance(update, CallbackQuery):
-            callback_data = MenuCallBack.unpack(update.data)
             menu_name, level, category, page, product_id = (
                 callback_data.menu_name,
                 callback_data.level,
@@ -89,7 +90,8 @@ async def process_menu_command(
         if is_callback:
             try:
                 if isinstance(content, types.InputMediaPhoto):
-                    await target.edit_media(media=content, reply_markup=keyboard)
+                    sent = await target.edit_media(media=content, reply_markup=keyboard)
+                    await MediaCache.remember(content.media, sent)
                 else:
                     await target.edit_text(
                         text=content, reply_markup=keyboard, parse_mode="HTML"
@@ -100,12 +102,13 @@ async def process_menu_command(
                 await update.answer()
         else:
             if isinstance(content, types.InputMediaPhoto):
-                await target.answer_photo(
+                sent = await target.answer_photo(
                     photo=content.media,
                     caption=content.caption,
                     reply_markup=keyboard,
                     parse_mode="HTML",
                 )
+                await MediaCache.remember(content.media, sent)
             else:
                 await target.answer(
                     text=content, reply_markup=keyboard, parse_mode="HTML"
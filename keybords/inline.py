@@ -1,15 +1,53 @@
+from itertools import chain, repeat
 from typing import Dict, List, Tuple
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from fluentogram import TranslatorRunner
-from parler.utils.context import switch_language
 
-from callbacks.callbacks import (LanguageCallBack, MenuCallBack,
-                                 OrderDetailCallBack)
-from django_project.telegrambot.usersmanage.models import Category
+from callbacks.callbacks import (CallbackTemplate, LanguageCallBack,
+                                 MenuCallBack, OrderDetailCallBack)
+from localization import cached_by_locale
+from utils.catalog import CategoryItem
 
+PAGE_OFFSETS = {"next": 1, "previous": -1}
 
+ADD_TO_CART = CallbackTemplate(
+    MenuCallBack, "level", "product_id", menu_name="add_to_cart"
+)
+CART_ACTIONS = {
+    menu_name: CallbackTemplate(
+        MenuCallBack, "level", "product_id", "page", menu_name=menu_name
+    )
+    for menu_name in ("delete", "decrement", "increment")
+}
+CART_PAGES = {
+    menu_name: CallbackTemplate(MenuCallBack, "level", "page", menu_name=menu_name)
+    for menu_name in PAGE_OFFSETS
+}
+CATEGORY_PAGES = {
+    menu_name: CallbackTemplate(
+        MenuCallBack, "level", "category", "page", menu_name=menu_name
+    )
+    for menu_name in PAGE_OFFSETS
+}
+
+
+# Same layout as InlineKeyboardBuilder.adjust() without the builder, which
+# costs ~20x more than the markup itself.
+def adjust_rows(
+    buttons: List[InlineKeyboardButton], sizes: Tuple[int]
+) -> List[List[InlineKeyboardButton]]:
+    rows = []
+    position = 0
+    for size in chain(sizes, repeat(sizes[-1])):
+        if position >= len(buttons):
+            return rows
+        rows.append(buttons[position : position + size])
+        position += size
+
+
+@cached_by_locale
 def get_user_main_btns(*, level: int, i18n: TranslatorRunner, sizes: Tuple[int] = (2,)):
     keyboard = InlineKeyboardBuilder()
     btns = {
@@ -72,6 +110,33 @@ def get_user_main_btns(*, level: int, i18n: TranslatorRunner, sizes: Tuple[int]
     return keyboard.adjust(*sizes).as_markup()
 
 
+@cached_by_locale
+def get_cart_menu_buttons(i18n: TranslatorRunner):
+    return (
+        InlineKeyboardButton(
+            text=i18n.main_menu_button(),
+            callback_data=MenuCallBack(level=0, menu_name="main").pack(),
+        ),
+        InlineKeyboardButton(
+            text=i18n.order_button(),
+            callback_data=MenuCallBack(level=0, menu_name="order").pack(),
+        ),
+    )
+
+
+@cached_by_locale
+def get_empty_cart_keyboard(i18n: TranslatorRunner, sizes: tuple[int] = (3,)):
+    keyboard = InlineKeyboardBuilder()
+    keyboard.add(
+        InlineKeyboardButton(
+            text=i18n.main_menu_button(),
+            callback_data=MenuCallBack(level=0, menu_name="main").pack(),
+        )
+    )
+
+    return keyboard.adjust(*sizes).as_markup()
+
+
 def get_user_cart(
     *,
     i18n: TranslatorRunner,
@@ -81,87 +146,45 @@ def get_user_cart(
     product_id: int | None,
     sizes: tuple[int] = (3,),
 ):
-    keyboard = InlineKeyboardBuilder()
-    if page:
-        keyboard.add(
-            InlineKeyboardButton(
-                text=i18n.delete_button(),
-                callback_data=MenuCallBack(
-                    level=level, menu_name="delete", product_id=product_id, page=page
-                ).pack(),
-            )
-        )
-        keyboard.add(
-            InlineKeyboardButton(
-                text="-1",
-                callback_data=MenuCallBack(
-                    level=level, menu_name="decrement", product_id=product_id, page=page
-                ).pack(),
-            )
-        )
-        keyboard.add(
-            InlineKeyboardButton(
-                text="+1",
-                callback_data=MenuCallBack(
-                    level=level, menu_name="increment", product_id=product_id, page=page
-                ).pack(),
-            )
-        )
+    if not page:
+        return get_empty_cart_keyboard(i18n=i18n, sizes=sizes)
 
-        keyboard.adjust(*sizes)
-
-        row = []
-
-        for text, menu_name in pagination_btns.items():
-            if menu_name == "next":
-                row.append(
-                    InlineKeyboardButton(
-                        text=text,
-                        callback_data=MenuCallBack(
-                            level=level, menu_name=menu_name, page=page + 1
-                        ).pack(),
-                    )
-                )
-            elif menu_name == "previous":
-                row.append(
-                    InlineKeyboardButton(
-                        text=text,
-                        callback_data=MenuCallBack(
-                            level=level, menu_name=menu_name, page=page - 1
-                        ).pack(),
-                    )
-                )
-
-        keyboard.row(*row)
-
-        row2 = [
-            InlineKeyboardButton(
-                text=i18n.main_menu_button(),
-                callback_data=MenuCallBack(level=0, menu_name="main").pack(),
+    buttons = [
+        InlineKeyboardButton(
+            text=text,
+            callback_data=CART_ACTIONS[menu_name].pack(
+                level=level, product_id=product_id, page=page
             ),
-            InlineKeyboardButton(
-                text=i18n.order_button(),
-                callback_data=MenuCallBack(level=0, menu_name="order").pack(),
+        )
+        for text, menu_name in (
+            (i18n.delete_button(), "delete"),
+            ("-1", "decrement"),
+            ("+1", "increment"),
+        )
+    ]
+    row = [
+        InlineKeyboardButton(
+            text=text,
+            callback_data=CART_PAGES[menu_name].pack(
+                level=level, page=page + PAGE_OFFSETS[menu_name]
             ),
-        ]
-        return keyboard.row(*row2).as_markup()
-    else:
-        keyboard.add(
-            InlineKeyboardButton(
-                text=i18n.main_menu_button(),
-                callback_data=MenuCallBack(level=0, menu_name="main").pack(),
-            )
         )
+        for text, menu_name in pagination_btns.items()
+        if menu_name in PAGE_OFFSETS
+    ]
 
-        return keyboard.adjust(*sizes).as_markup()
+    rows = adjust_rows(buttons, sizes)
+    if row:
+        rows.append(row)
+    rows.append(list(get_cart_menu_buttons(i18n=i18n)))
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def get_user_catalog_btns(
     *,
     i18n: TranslatorRunner,
     level: int,
-    user_language: str,
-    categories: List[Category],
+    categories: List[CategoryItem],
     sizes: Tuple[int] = (2,),
 ):
     keyboard = InlineKeyboardBuilder()
@@ -179,19 +202,32 @@ def get_user_catalog_btns(
         )
     )
     for c in categories:
-        with switch_language(c, user_language):
-            keyboard.add(
-                InlineKeyboardButton(
-                    text=c.name,
-                    callback_data=MenuCallBack(
-                        level=level + 1, menu_name=c.name, category=c.id
-                    ).pack(),
-                )
+        keyboard.add(
+            InlineKeyboardButton(
+                text=c.name,
+                callback_data=MenuCallBack(
+                    level=level + 1, menu_name="products", category=c.id
+                ).pack(),
             )
+        )
 
     return keyboard.adjust(*sizes).as_markup()
 
 
+@cached_by_locale
+def get_products_nav_buttons(i18n: TranslatorRunner, level: int):
+    return (
+        InlineKeyboardButton(
+            text=i18n.back_button(),
+            callback_data=MenuCallBack(level=level - 1, menu_name="catalog").pack(),
+        ),
+        InlineKeyboardButton(
+            text=i18n.cart_button(),
+            callback_data=MenuCallBack(level=3, menu_name="cart").pack(),
+        ),
+    )
+
+
 def get_products_btns(
     *,
     i18n: TranslatorRunner,
@@ -203,61 +239,28 @@ def get_products_btns(
     product_id: int,
     sizes: Tuple[int] = (2, 1),
 ):
-    keyboard = InlineKeyboardBuilder()
-
-    keyboard.add(
-        InlineKeyboardButton(
-            text=i18n.back_button(),
-            callback_data=MenuCallBack(level=level - 1, menu_name="catalog").pack(),
-        )
-    )
-    keyboard.add(
-        InlineKeyboardButton(
-            text=i18n.cart_button(),
-            callback_data=MenuCallBack(level=3, menu_name="cart").pack(),
-        )
-    )
-    keyboard.add(
+    buttons = [
+        *get_products_nav_buttons(i18n=i18n, level=level),
         InlineKeyboardButton(
             text=i18n.buy_button(),
-            callback_data=MenuCallBack(
-                level=level, menu_name="add_to_cart", product_id=product_id
-            ).pack(),
+            callback_data=ADD_TO_CART.pack(level=level, product_id=product_id),
+        ),
+    ]
+    row = [
+        InlineKeyboardButton(
+            text=text,
+            callback_data=CATEGORY_PAGES[menu_name].pack(
+                level=level, category=category, page=page + PAGE_OFFSETS[menu_name]
+            ),
         )
-    )
-
-    keyboard.adjust(*sizes)
-
-    row = []
-
-    for text, menu_name in pagination_btns.items():
-        if menu_name == "next":
-            row.append(
-                InlineKeyboardButton(
-                    text=text,
-                    callback_data=MenuCallBack(
-                        level=level,
-                        menu_name=menu_name,
-                        category=category,
-                        page=page + 1,
-                    ).pack(),
-                )
-            )
-
-        elif menu_name == "previous":
-            row.append(
-                InlineKeyboardButton(
-                    text=text,
-                    callback_data=MenuCallBack(
-                        level=level,
-                        menu_name=menu_name,
-                        category=category,
-                        page=page - 1,
-                    ).pack(),
-                )
-            )
+        for text, menu_name in pagination_btns.items()
+        if menu_name in PAGE_OFFSETS
+    ]
 
-    return keyboard.row(*row).as_markup()
+    rows = adjust_rows(buttons, sizes)
+    if row:
+        rows.append(row)
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
 def get_callback_btns(*, btns: Dict[str, str], sizes: Tuple[int] = (2,)):
@@ -293,6 +296,7 @@ def get_order_details_keyboard(orders, i18n):
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@cached_by_locale
 def get_inline_back_button(i18n: TranslatorRunner):
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -306,6 +310,7 @@ def get_inline_back_button(i18n: TranslatorRunner):
     )
 
 
+@cached_by_locale
 def get_select_payment_keyboard(i18n: TranslatorRunner):
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -331,6 +336,7 @@ def get_select_payment_keyboard(i18n: TranslatorRunner):
     )
 
 
+@cached_by_locale
 def get_language_selection_keyboard(i18n: TranslatorRunner):
     return InlineKeyboardMarkup(
         inline_keyboard=[
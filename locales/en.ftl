@@ -250,6 +250,10 @@ admin_statistics_text =
     📦 Total products: {$products}
     📂 Products by Category:
      {$category_stats_text}
+    ⚡ Caches:
+     {$cache_stats_text}
+    🗄️ Database pool:
+     {$db_pool_stats_text}
 admin_products_list = Ok, list of products ⏫
 admin_choose_category = Choose the category:
 admin_product_card =
@@ -279,7 +283,17 @@ admin_no_previous_step = Previous step is not available, or write "cancel"
 admin_previous_step =
     Ok, you are on the previous step
     {$step_text}
-admin_newsletter_content = Enter the content of the newsletter
+admin_newsletter_content =
+    Send the newsletter for {$language} users.
+    Text, photos, videos, documents and albums are supported.
+admin_newsletter_content_optional =
+    Send the newsletter for {$language} users, or write "." to send them the first version
+admin_newsletter_progress =
+    <b>📣 Newsletter in progress...
+    📬 Processed: {$processed} / {$total}
+    ✅ Sent: {$success_count}
+    ❌ Errors: {$error_count}
+    ⚡ Speed: <code>{$rate} msg/sec.</code></b>
 admin_newsletter_success =
     <b> 🎉 Newsletter sent successfully!
     ✅ Sent to: {$success_count}
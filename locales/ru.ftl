@@ -246,6 +246,10 @@ admin_statistics_text =
     📦 Всего товаров: {$products}
     📂 Товары по категориям:
      {$category_stats_text}
+    ⚡ Кэши:
+     {$cache_stats_text}
+    🗄️ Пул подключений к БД:
+     {$db_pool_stats_text}
 admin_products_list = Хорошо, список товаров ⏫
 admin_choose_category = Выберите категорию:
 admin_product_card =
@@ -275,7 +279,17 @@ admin_no_previous_step = Предыдущий шаг недоступен, ил
 admin_previous_step =
     Хорошо, вы на предыдущем шаге
     {$step_text}
-admin_newsletter_content = Введите содержание рассылки
+admin_newsletter_content =
+    Отправьте рассылку для пользователей ({$language}).
+    Поддерживаются текст, фото, видео, документы и альбомы.
+admin_newsletter_content_optional =
+    Отправьте рассылку для пользователей ({$language}) или напишите ".", чтобы отправить им первую версию
+admin_newsletter_progress =
+    <b>📣 Рассылка выполняется...
+    📬 Обработано: {$processed} / {$total}
+    ✅ Отправлено: {$success_count}
+    ❌ Ошибки: {$error_count}
+    ⚡ Скорость: <code>{$rate} сообщ./сек.</code></b>
 admin_newsletter_success =
     <b> 🎉 Рассылка отправлена успешно!
     ✅ Отправлено: {$success_count}
@@ -1,34 +1,169 @@
+import ast
+import hashlib
+import importlib.util
+import logging
+import os
+from functools import cached_property, wraps
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
 
-from fluent_compiler.bundle import FluentBundle
-from fluentogram import FluentTranslator, TranslatorHub
+from fluentogram import FluentTranslator, TranslatorHub, TranslatorRunner
 
+logger = logging.getLogger(__name__)
 
-def setup_localization() -> TranslatorHub:
-    locales_dir = Path(__file__).parent / "locales"
+LOCALES_DIR = Path(__file__).parent / "locales"
+COMPILED_DIR = LOCALES_DIR / "compiled"
+ROOT_LOCALE = "en"
 
-    en_translator = FluentTranslator(
-        locale="en",
-        translator=FluentBundle.from_files(
-            locale="en", filenames=[str(locales_dir / "en.ftl")]
-        ),
-    )
+MODULE_HEADER = """# Generated from {filename} by `python localization.py`. Do not edit.
+import babel
+import babel.plural
+from fluent_compiler import builtins as _builtins
+from fluent_compiler import runtime as _runtime
+
+globals().update({{name: getattr(_runtime, name) for name in _runtime.__all__}})
+globals().update(
+    {{name: value for name, value in vars(_builtins).items() if not name.startswith("__")}}
+)
+
+SOURCE_CHECKSUM = "{checksum}"
+
+locale = babel.Locale.parse("{locale}")
+_plural_form_for_number = babel.plural.to_python(locale.plural_form)
+
+
+def plural_form_for_number(number):
+    try:
+        return _plural_form_for_number(number)
+    except TypeError:
+        return None
+
+
+"""
 
-    ru_translator = FluentTranslator(
-        locale="ru",
-        translator=FluentBundle.from_files(
-            locale="ru", filenames=[str(locales_dir / "ru.ftl")]
-        ),
+
+def build_locale_module(locale: str, ftl_path: Path, checksum: str) -> str:
+    from fluent_compiler.compiler import compile_messages
+    from fluent_compiler.resource import FtlResource
+
+    compiled = compile_messages(locale, [FtlResource.from_file(str(ftl_path))])
+    for message_id, error in compiled.errors:
+        logger.warning("%s: %s: %s", ftl_path.name, message_id, error)
+
+    messages = ",\n".join(
+        f"    {message_id!r}: {function.__name__}"
+        for message_id, function in compiled.message_functions.items()
     )
+    return (
+        MODULE_HEADER.format(filename=ftl_path.name, checksum=checksum, locale=locale)
+        + ast.unparse(compiled.module_ast)
+        + f"\n\n\nMESSAGES = {{\n{messages}\n}}\n"
+    )
+
+
+def _import_compiled(locale: str) -> ModuleType | None:
+    path = COMPILED_DIR / f"{locale}.py"
+    if not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location(f"locales.compiled.{locale}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_compiled_messages(locale: str, ftl_path: Path) -> dict[str, Callable]:
+    checksum = hashlib.sha256(ftl_path.read_bytes()).hexdigest()
+    module = _import_compiled(locale)
+    if module is not None and module.SOURCE_CHECKSUM == checksum:
+        return module.MESSAGES
+
+    logger.info("Compiling %s", ftl_path.name)
+    source = build_locale_module(locale, ftl_path, checksum)
+    try:
+        COMPILED_DIR.mkdir(exist_ok=True)
+        tmp_path = COMPILED_DIR / f".{locale}.py.tmp"
+        tmp_path.write_text(source, encoding="utf-8")
+        os.replace(tmp_path, COMPILED_DIR / f"{locale}.py")
+        return _import_compiled(locale).MESSAGES
+    except OSError:
+        logger.warning("Can't write compiled %s, using it from memory", ftl_path.name)
+        module = ModuleType(f"locales.compiled.{locale}")
+        exec(compile(source, ftl_path.name, "exec"), module.__dict__)
+        return module.MESSAGES
+
+
+class CompiledFluentBundle:
+    def __init__(self, locale: str, ftl_path: Path) -> None:
+        self.locale = locale
+        self.ftl_path = ftl_path
+        self._rendered: dict[str, str] = {}
+
+    @cached_property
+    def messages(self) -> dict[str, Callable]:
+        return load_compiled_messages(self.locale, self.ftl_path)
+
+    @property
+    def _compiled_messages(self) -> dict[str, Callable]:
+        # Only accessed by FluentTranslator.update_translation, which replaces
+        # a message in place, so rendered texts can't be trusted anymore.
+        self._rendered.clear()
+        return self.messages
+
+    def format(self, message_id: str, args: dict[str, Any] | None = None):
+        if args:
+            errors = []
+            return self.messages[message_id](args, errors), errors
+
+        text = self._rendered.get(message_id)
+        if text is None:
+            errors = []
+            text = self.messages[message_id]({}, errors)
+            if errors:
+                return text, errors
+            self._rendered[message_id] = text
+        return text, []
+
+
+def runner_locale(i18n: TranslatorRunner) -> str:
+    return i18n.translators[0].locale
+
+
+def cached_by_locale(func: Callable) -> Callable:
+    cache = {}
+
+    @wraps(func)
+    def wrapper(i18n: TranslatorRunner, **kwargs):
+        key = (runner_locale(i18n), *sorted(kwargs.items()))
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = func(i18n=i18n, **kwargs)
+        return result
+
+    return wrapper
+
+
+def setup_localization() -> TranslatorHub:
+    translators = [
+        FluentTranslator(
+            locale=path.stem, translator=CompiledFluentBundle(path.stem, path)
+        )
+        for path in sorted(LOCALES_DIR.glob("*.ftl"))
+    ]
 
     translator_hub = TranslatorHub(
         locales_map={
-            "en": ("en",),
-            "ru": ("ru",),
+            translator.locale: (translator.locale,) for translator in translators
         },
-        translators=[en_translator, ru_translator],
-        root_locale="en",
+        translators=translators,
+        root_locale=ROOT_LOCALE,
         separator="_",
     )
 
     return translator_hub
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for path in sorted(LOCALES_DIR.glob("*.ftl")):
+        load_compiled_messages(path.stem, path)
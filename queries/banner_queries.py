@@ -3,6 +3,7 @@ from typing import Optional
 from asgiref.sync import sync_to_async
 
 from django_project.telegrambot.usersmanage.models import Banner
+from queries.translation_queries import with_translations
 
 
 @sync_to_async
@@ -20,14 +21,14 @@ def change_banner_image(name: str, image: str) -> Banner:
     return Banner.objects.filter(name=name).update(image=image)
 
 
-@sync_to_async
-def get_banner(page: str, user_language: str = "en") -> Optional[Banner]:
-    try:
-        return Banner.objects.language(user_language).filter(name=page).first()
-    except Banner.DoesNotExist:
-        return Banner.objects.filter(name=page).first()
+async def get_banner(page: str, user_language: str = "en") -> Optional[Banner]:
+    banner = await with_translations(
+        Banner.objects.filter(name=page), user_language
+    ).afirst()
+    if banner is not None:
+        banner.set_current_language(user_language)
+    return banner
 
 
-@sync_to_async
-def get_info_pages() -> list[Banner]:
-    return list(Banner.objects.all())
+async def get_info_pages() -> list[Banner]:
+    return [banner async for banner in Banner.objects.all()]
@@ -0,0 +1,38 @@
+from asgiref.sync import sync_to_async
+
+from django_project.telegrambot.usersmanage.models import (Broadcast,
+                                                           TelegramUser)
+
+
+@sync_to_async
+def create_broadcast(admin_id: int, variants: dict[str, list[int]]) -> Broadcast:
+    return Broadcast.objects.create(
+        admin_id=admin_id, variants=variants, total=TelegramUser.objects.count()
+    )
+
+
+@sync_to_async
+def get_running_broadcasts() -> list[Broadcast]:
+    return list(Broadcast.objects.filter(status="running").order_by("id"))
+
+
+@sync_to_async
+def get_broadcast_recipients(after_id: int, limit: int) -> list[tuple[int, int, str]]:
+    return list(
+        TelegramUser.objects.filter(id__gt=after_id)
+        .order_by("id")
+        .values_list("id", "user_id", "language")[:limit]
+    )
+
+
+@sync_to_async
+def save_broadcast_progress(broadcast: Broadcast) -> None:
+    broadcast.save(
+        update_fields=[
+            "status",
+            "last_user_id",
+            "success_count",
+            "error_count",
+            "updated_at",
+        ]
+    )
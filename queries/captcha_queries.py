@@ -1,31 +1,69 @@
-from asgiref.sync import sync_to_async
-from django.db import transaction
+from datetime import datetime, timedelta
+
 from django.utils import timezone
 
+from app_config import env_config
 from django_project.telegrambot.usersmanage.models import (CaptchaRecord,
                                                            TelegramUser)
+from utils.ttl_cache import TTLCache
+
+CAPTCHA_EXPIRATION = timedelta(weeks=2)
 
+captcha_cache = TTLCache(
+    "captcha",
+    maxsize=env_config.CAPTCHA_CACHE_SIZE,
+    ttl=env_config.CAPTCHA_NEGATIVE_CACHE_TTL,
+)
 
-@sync_to_async
-def mark_captcha_passed(user_id: int, selected_sticker: str) -> bool:
-    try:
-        with transaction.atomic():
-            user = TelegramUser.objects.get_or_create(user_id=user_id)[0]
-            CaptchaRecord.objects.create(
-                user=user,
-                captcha=selected_sticker,
-                timestamp=timezone.now(),
-                is_passed=True,
-            )
+
+def _cache_captcha_state(user_id: int, passed_at: datetime | None) -> bool:
+    if passed_at is not None:
+        remaining = (passed_at + CAPTCHA_EXPIRATION - timezone.now()).total_seconds()
+        if remaining > 0:
+            captcha_cache.set(user_id, True, ttl=remaining)
             return True
-    except CaptchaRecord.DoesNotExist:
-        return False
+
+    captcha_cache.set(user_id, False)
+    return False
+
+
+async def _save_captcha_passed(user_id: int, selected_sticker: str) -> datetime:
+    user = (await TelegramUser.objects.aget_or_create(user_id=user_id))[0]
+    record, _ = await CaptchaRecord.objects.aupdate_or_create(
+        user=user,
+        defaults={
+            "captcha": selected_sticker,
+            "timestamp": timezone.now(),
+            "is_passed": True,
+        },
+    )
+    return record.timestamp
+
+
+async def mark_captcha_passed(user_id: int, selected_sticker: str) -> bool:
+    passed_at = await _save_captcha_passed(user_id, selected_sticker)
+    return _cache_captcha_state(user_id, passed_at)
+
+
+async def get_captcha_passed_at(user_id: int) -> datetime | None:
+    return (
+        await CaptchaRecord.objects.filter(
+            user__user_id=user_id, timestamp__gt=timezone.now() - CAPTCHA_EXPIRATION
+        )
+        .order_by("-timestamp")
+        .values_list("timestamp", flat=True)
+        .afirst()
+    )
+
+
+async def has_passed_captcha(user_id: int) -> bool:
+    passed = captcha_cache.get(user_id)
+    if passed is None:
+        passed = _cache_captcha_state(user_id, await get_captcha_passed_at(user_id))
+    return passed
 
 
-@sync_to_async
-def get_captcha_status(user_id: int) -> CaptchaRecord | bool:
-    try:
-        user = TelegramUser.objects.get(user_id=user_id)
-        return CaptchaRecord.objects.filter(user_id=user.id).first()
-    except TelegramUser.DoesNotExist:
+async def get_captcha_status(user_id: int) -> CaptchaRecord | bool:
+    if not await TelegramUser.objects.filter(user_id=user_id).aexists():
         return False
+    return await CaptchaRecord.objects.filter(user__user_id=user_id).afirst()
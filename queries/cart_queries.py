@@ -1,71 +1,81 @@
+from decimal import Decimal
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-from django.db import transaction
-from django.db.models import F
+from django.db.models import Count, F, Sum
 
 from django_project.telegrambot.usersmanage.models import Cart, TelegramUser
+from queries.translation_queries import (activate_translations,
+                                         aget_translated, with_translations)
+from utils.paginator import QuerySetPaginator
 
 
-@sync_to_async
-def add_to_cart(user_id: int, product_id: int) -> Optional[Cart]:
-    try:
-        with transaction.atomic():
-            user = TelegramUser.objects.get(user_id=user_id)
+async def add_to_cart(user_id: int, product_id: int) -> Optional[Cart]:
+    user = await TelegramUser.objects.filter(user_id=user_id).afirst()
+    if user is None:
+        return None
 
-            cart_item, created = Cart.objects.get_or_create(
-                user=user, product_id=product_id, defaults={"quantity": 1}
-            )
+    cart_item, created = await Cart.objects.aget_or_create(
+        user=user, product_id=product_id, defaults={"quantity": 1}
+    )
 
-            if not created:
-                cart_item.quantity = F("quantity") + 1
-                cart_item.save()
+    if not created:
+        await Cart.objects.filter(id=cart_item.id).aupdate(quantity=F("quantity") + 1)
+        await cart_item.arefresh_from_db()
 
-            cart_item.refresh_from_db()
-            return cart_item
-    except TelegramUser.DoesNotExist:
-        return None
-    except Cart.DoesNotExist:
-        return None
+    return cart_item
 
 
-@sync_to_async
-def get_cart_items(user_id: int) -> list[Cart]:
-    return list(
-        Cart.objects.filter(user__user_id=user_id).select_related("product").all()
+async def get_cart_items(user_id: int, language_code: str = "en") -> list[Cart]:
+    return await aget_translated(
+        Cart.objects.filter(user__user_id=user_id).select_related("product"),
+        language_code,
+        related="product",
     )
 
 
-@sync_to_async
-def get_user_carts(user_id: int) -> list[Cart]:
-    user = TelegramUser.objects.get(user_id=user_id)
-    return list(Cart.objects.filter(user=user).select_related("product"))
+async def get_user_carts(user_id: int) -> list[Cart]:
+    return [
+        cart
+        async for cart in Cart.objects.filter(user__user_id=user_id).select_related(
+            "product"
+        )
+    ]
+
+
+async def get_user_cart_page(
+    user_id: int, page: int = 1, language_code: str = "en"
+) -> tuple[QuerySetPaginator, list[Cart], Decimal]:
+    carts = Cart.objects.filter(user__user_id=user_id)
+    summary = await carts.aaggregate(
+        count=Count("id"), total=Sum(F("quantity") * F("product__price"))
+    )
+
+    paginator = QuerySetPaginator(
+        with_translations(
+            carts.select_related("product").order_by("id"),
+            language_code,
+            related="product",
+        ),
+        page,
+        count=summary["count"],
+    )
+    page_carts = await paginator.aget_page() if paginator.pages else []
+    activate_translations(page_carts, language_code, related="product")
+    return paginator, page_carts, summary["total"] or Decimal(0)
 
 
-@sync_to_async
-def delete_from_cart(user_id: int, product_id: int) -> None:
-    user = TelegramUser.objects.get(user_id=user_id)
-    Cart.objects.filter(user=user, product_id=product_id).delete()
+async def delete_from_cart(user_id: int, product_id: int) -> None:
+    await Cart.objects.filter(user__user_id=user_id, product_id=product_id).adelete()
 
 
-@sync_to_async
-def clear_cart(user_id: int) -> None:
-    user = TelegramUser.objects.get(user_id=user_id)
-    Cart.objects.filter(user=user).delete()
+async def clear_cart(user_id: int) -> None:
+    await Cart.objects.filter(user__user_id=user_id).adelete()
 
 
-@sync_to_async
-def reduce_product_in_cart(user_id: int, product_id: int) -> bool:
-    try:
-        user = TelegramUser.objects.get(user_id=user_id)
-        cart_item = Cart.objects.get(user=user, product_id=product_id)
+async def reduce_product_in_cart(user_id: int, product_id: int) -> bool:
+    carts = Cart.objects.filter(user__user_id=user_id, product_id=product_id)
+    if await carts.filter(quantity__gt=1).aupdate(quantity=F("quantity") - 1):
+        return True
 
-        if cart_item.quantity > 1:
-            cart_item.quantity = F("quantity") - 1
-            cart_item.save()
-            return True
-        else:
-            cart_item.delete()
-            return False
-    except Cart.DoesNotExist:
-        return False
+    await carts.adelete()
+    return False
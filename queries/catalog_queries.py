@@ -0,0 +1,64 @@
+from django.db.models import Count, Max, Model
+
+from django_project.telegrambot.usersmanage.models import Category, Product
+
+
+async def _get_translations(
+    model: type[Model], fields: tuple[str, ...], **filters
+) -> dict[int, dict[str, tuple]]:
+    translations = model._parler_meta.root_model.objects.filter(**filters)
+
+    result: dict[int, dict[str, tuple]] = {}
+    async for master_id, language_code, *values in translations.values_list(
+        "master_id", "language_code", *fields
+    ):
+        result.setdefault(master_id, {})[language_code] = tuple(values)
+    return result
+
+
+async def get_catalog_version() -> tuple:
+    categories = await Category.objects.aaggregate(
+        count=Count("id"), updated_at=Max("updated_at")
+    )
+    products = await Product.objects.aaggregate(
+        count=Count("id"), updated_at=Max("updated_at")
+    )
+    return (
+        categories["count"],
+        categories["updated_at"],
+        products["count"],
+        products["updated_at"],
+    )
+
+
+async def get_category_rows() -> tuple[list[int], dict[int, dict[str, tuple]]]:
+    category_ids = [
+        category_id
+        async for category_id in Category.objects.order_by("id").values_list(
+            "id", flat=True
+        )
+    ]
+    return category_ids, await _get_translations(Category, ("name",))
+
+
+async def get_product_rows(
+    category_ids: list[int] | None = None,
+) -> tuple[list[tuple], dict[int, dict[str, tuple]]]:
+    products = Product.objects.order_by("id")
+    filters = {}
+    if category_ids is not None:
+        products = products.filter(category_id__in=category_ids)
+        filters["master__category_id__in"] = category_ids
+
+    rows = [
+        row async for row in products.values_list("id", "category_id", "price", "image")
+    ]
+    return rows, await _get_translations(Product, ("name", "description"), **filters)
+
+
+async def get_product_category(product_id: int) -> int | None:
+    return (
+        await Product.objects.filter(id=product_id)
+        .values_list("category_id", flat=True)
+        .afirst()
+    )
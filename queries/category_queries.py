@@ -1,11 +1,11 @@
 from asgiref.sync import sync_to_async
 
 from django_project.telegrambot.usersmanage.models import Category
+from queries.translation_queries import aget_translated
 
 
-@sync_to_async
-def get_categories() -> list[Category]:
-    return list(Category.objects.all())
+async def get_categories(language_code: str = "en") -> list[Category]:
+    return await aget_translated(Category.objects.all(), language_code)
 
 
 @sync_to_async
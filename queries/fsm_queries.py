@@ -0,0 +1,72 @@
+from datetime import timedelta
+from typing import Any, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from django_project.telegrambot.usersmanage.models import FSMRecord
+
+
+def _expires_at(ttl: Optional[int]):
+    return timezone.now() + timedelta(seconds=ttl) if ttl else None
+
+
+def _active_records():
+    return FSMRecord.objects.filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+    )
+
+
+def _upsert(key: str, ttl: Optional[int], **fields: Any) -> None:
+    FSMRecord.objects.filter(key=key, expires_at__lte=timezone.now()).delete()
+    FSMRecord.objects.bulk_create(
+        [FSMRecord(key=key, expires_at=_expires_at(ttl), **fields)],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=[*fields, "expires_at", "updated_at"],
+    )
+
+
+@sync_to_async
+def get_fsm_state(key: str) -> Optional[str]:
+    return _active_records().filter(key=key).values_list("state", flat=True).first()
+
+
+@sync_to_async
+def set_fsm_state(key: str, state: Optional[str], ttl: Optional[int] = None) -> None:
+    _upsert(key, ttl, state=state)
+
+
+@sync_to_async
+def get_fsm_data(key: str) -> dict[str, Any]:
+    return _active_records().filter(key=key).values_list("data", flat=True).first() or {}
+
+
+@sync_to_async
+def set_fsm_data(key: str, data: dict[str, Any], ttl: Optional[int] = None) -> None:
+    _upsert(key, ttl, data=data)
+
+
+@sync_to_async
+def update_fsm_data(
+    key: str, data: dict[str, Any], ttl: Optional[int] = None
+) -> dict[str, Any]:
+    with transaction.atomic():
+        current = (
+            _active_records()
+            .select_for_update()
+            .filter(key=key)
+            .values_list("data", flat=True)
+            .first()
+            or {}
+        )
+        current.update(data)
+        _upsert(key, ttl, data=current)
+        return current
+
+
+@sync_to_async
+def delete_expired_fsm_records() -> int:
+    return FSMRecord.objects.filter(expires_at__lte=timezone.now()).delete()[0]
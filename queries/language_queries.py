@@ -1,32 +1,45 @@
-from asgiref.sync import sync_to_async
+from django.utils import timezone
 
+from app_config import env_config
 from django_project.telegrambot.usersmanage.models import TelegramUser
+from utils.ttl_cache import TTLCache
 
+user_language_cache = TTLCache(
+    "language",
+    maxsize=env_config.LANGUAGE_CACHE_SIZE,
+    ttl=env_config.LANGUAGE_CACHE_TTL,
+)
 
-@sync_to_async
-def get_user_language(user_id: int) -> str:
-    try:
-        user = TelegramUser.objects.get(user_id=user_id)
-        return user.language
-    except TelegramUser.DoesNotExist:
-        return "en"
-
-
-@sync_to_async
-def set_user_language(user_id: int, language: str) -> bool:
-    try:
-        user = TelegramUser.objects.get(user_id=user_id)
-        user.language = language
-        user.save()
-        return True
-    except TelegramUser.DoesNotExist:
-        return False
-
-
-@sync_to_async
-def get_or_create_user_language(user_id: int, default_language: str = "en") -> str:
-    try:
-        user = TelegramUser.objects.get(user_id=user_id)
-        return user.language
-    except TelegramUser.DoesNotExist:
-        return default_language
+
+async def get_user_language(user_id: int) -> str:
+    return await _fetch_user_language(user_id, "en")
+
+
+async def set_user_language(user_id: int, language: str) -> bool:
+    updated = bool(
+        await TelegramUser.objects.filter(user_id=user_id).aupdate(
+            language=language, updated_at=timezone.now()
+        )
+    )
+    if updated:
+        user_language_cache.set(user_id, language)
+    return updated
+
+
+async def _fetch_user_language(user_id: int, default_language: str) -> str:
+    language = (
+        await TelegramUser.objects.filter(user_id=user_id)
+        .values_list("language", flat=True)
+        .afirst()
+    )
+    return language or default_language
+
+
+async def get_or_create_user_language(
+    user_id: int, default_language: str = "en"
+) -> str:
+    language = user_language_cache.get(user_id)
+    if language is None:
+        language = await _fetch_user_language(user_id, default_language)
+        user_language_cache.set(user_id, language)
+    return language
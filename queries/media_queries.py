@@ -0,0 +1,25 @@
+from asgiref.sync import sync_to_async
+
+from django_project.telegrambot.usersmanage.models import MediaFile
+
+
+@sync_to_async
+def get_media_files() -> dict[str, tuple[str, str]]:
+    return {
+        path: (fingerprint, file_id)
+        for path, fingerprint, file_id in MediaFile.objects.values_list(
+            "path", "fingerprint", "file_id"
+        )
+    }
+
+
+@sync_to_async
+def save_media_file(path: str, fingerprint: str, file_id: str) -> None:
+    MediaFile.objects.update_or_create(
+        path=path, defaults={"fingerprint": fingerprint, "file_id": file_id}
+    )
+
+
+@sync_to_async
+def delete_media_file(path: str) -> None:
+    MediaFile.objects.filter(path=path).delete()
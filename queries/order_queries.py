@@ -1,15 +1,22 @@
+from collections import Counter
+from decimal import Decimal
+
 from asgiref.sync import sync_to_async
 from django.db import transaction
 
 from django_project.telegrambot.usersmanage.models import (Cart, Order,
                                                            OrderItem,
                                                            TelegramUser)
+from queries.translation_queries import aget_translated
 
 
-@sync_to_async
-def get_user_orders(user_id: int) -> list[Order]:
-    user = TelegramUser.objects.get(user_id=user_id)
-    return list(Order.objects.filter(user=user).order_by("-created_at"))
+async def get_user_orders(user_id: int) -> list[Order]:
+    return [
+        order
+        async for order in Order.objects.filter(user__user_id=user_id).order_by(
+            "-created_at"
+        )
+    ]
 
 
 @sync_to_async
@@ -26,57 +33,94 @@ def add_order(
         return None
 
 
-@sync_to_async
-def add_order_with_items(
-    user_id: int,
+def create_order_from_lines(
+    user: TelegramUser,
     name: str,
     phone: str,
     address: str,
     status: str,
-    cart_items: list[Cart],
+    lines: list[tuple[int, int, Decimal]],
 ) -> Order:
-    user = TelegramUser.objects.get(user_id=user_id)
-    try:
-        with transaction.atomic():
-            order = Order.objects.create(
-                user=user, name=name, phone=phone, address=address, status=status
-            )
+    order = Order.objects.create(
+        user=user, name=name, phone=phone, address=address, status=status
+    )
+    OrderItem.objects.bulk_create(
+        OrderItem(order=order, product_id=product_id, quantity=quantity, price=price)
+        for product_id, quantity, price in lines
+    )
+
+    order.items_count = sum(quantity for _, quantity, _ in lines)
+    order.total = sum(
+        (Decimal(price) * quantity for _, quantity, price in lines), Decimal(0)
+    )
+    return order
 
-            for cart_item in cart_items:
-                OrderItem.objects.create(
-                    order=order,
-                    product=cart_item.product,
-                    quantity=cart_item.quantity,
-                    price=cart_item.product.price,
-                )
 
-            return order
-    except (OrderItem.DoesNotExist, Order.DoesNotExist):
-        raise
+def add_order_with_items(
+    user: TelegramUser,
+    name: str,
+    phone: str,
+    address: str,
+    status: str = "pending",
+    lines: list[tuple[int, int, Decimal]] | None = None,
+) -> Order | None:
+    # Without lines the whole cart is ordered, otherwise the given lines are
+    # ordered and their quantities are taken out of the cart.
+    with transaction.atomic():
+        carts = list(
+            Cart.objects.select_for_update(of=("self",))
+            .filter(user=user)
+            .order_by("id")
+            .values_list("id", "product_id", "quantity", "product__price")
+        )
+        if lines is None:
+            lines = [
+                (product_id, quantity, price)
+                for _, product_id, quantity, price in carts
+            ]
+            if not lines:
+                return None
+
+        order = create_order_from_lines(user, name, phone, address, status, lines)
+
+        ordered = Counter()
+        for product_id, quantity, _ in lines:
+            ordered[product_id] += quantity
+        emptied, remaining = [], []
+        for cart_id, product_id, quantity, _ in carts:
+            if product_id not in ordered:
+                continue
+            left = quantity - ordered[product_id]
+            if left > 0:
+                remaining.append(Cart(id=cart_id, quantity=left))
+            else:
+                emptied.append(cart_id)
+
+        if emptied:
+            Cart.objects.filter(id__in=emptied).delete()
+        if remaining:
+            Cart.objects.bulk_update(remaining, ["quantity"])
+        return order
 
 
-@sync_to_async
-def get_order_by_id(order_id: str) -> Order:
-    return Order.objects.filter(id=order_id).first()
+async def get_order_by_id(order_id: str) -> Order:
+    return await Order.objects.filter(id=order_id).afirst()
 
 
-@sync_to_async
-def get_order_items(order_id: str) -> list[OrderItem]:
-    items = list(
-        OrderItem.objects.filter(order_id=order_id).select_related("product").all()
+async def get_order_items(order_id: str, language_code: str = "en") -> list[OrderItem]:
+    return await aget_translated(
+        OrderItem.objects.filter(order_id=order_id).select_related("product"),
+        language_code,
+        related="product",
     )
-    return items
 
 
-@sync_to_async
-def total_orders() -> int:
-    return Order.objects.count()
+async def total_orders() -> int:
+    return await Order.objects.acount()
 
 
-@sync_to_async
-def get_order_status(order_id: str) -> str:
-    try:
-        order = Order.objects.get(id=order_id)
-        return order.status
-    except Order.DoesNotExist:
-        return "unknown"
+async def get_order_status(order_id: str) -> str:
+    status = (
+        await Order.objects.filter(id=order_id).values_list("status", flat=True).afirst()
+    )
+    return status or "unknown"
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.utils import timezone
+
+from django_project.telegrambot.usersmanage.models import (Cart, Order,
+                                                           PendingPayment,
+                                                           Product,
+                                                           TelegramUser)
+from queries.order_queries import add_order_with_items
+
+
+@sync_to_async
+def create_pending_payment(
+    invoice_id: int,
+    user_id: int,
+    crypto: str,
+    amount: float,
+    language: str,
+    name: str,
+    phone: str,
+    address: str,
+    timeout: int,
+) -> PendingPayment:
+    user = TelegramUser.objects.get(user_id=user_id)
+    items = [
+        {"product_id": product_id, "quantity": quantity, "price": price}
+        for product_id, quantity, price in Cart.objects.filter(user=user).values_list(
+            "product_id", "quantity", "product__price"
+        )
+    ]
+    return PendingPayment.objects.create(
+        invoice_id=invoice_id,
+        user=user,
+        crypto=crypto,
+        amount=Decimal(str(amount)),
+        language=language,
+        name=name,
+        phone=phone,
+        address=address,
+        items=items,
+        expires_at=timezone.now() + timedelta(seconds=timeout),
+    )
+
+
+@sync_to_async
+def get_pending_payments() -> list[PendingPayment]:
+    return list(PendingPayment.objects.select_related("user"))
+
+
+@sync_to_async
+def complete_pending_payment(
+    invoice_id: int, status: str = "completed"
+) -> tuple[PendingPayment, Order] | None:
+    with transaction.atomic():
+        payment = (
+            PendingPayment.objects.select_for_update()
+            .select_related("user")
+            .filter(invoice_id=invoice_id)
+            .first()
+        )
+        if payment is None:
+            return None
+
+        product_ids = set(
+            Product.objects.filter(
+                id__in=[item["product_id"] for item in payment.items]
+            ).values_list("id", flat=True)
+        )
+        order = add_order_with_items(
+            payment.user,
+            payment.name,
+            payment.phone,
+            payment.address,
+            status,
+            [
+                (item["product_id"], item["quantity"], item["price"])
+                for item in payment.items
+                if item["product_id"] in product_ids
+            ],
+        )
+
+        payment.delete()
+        return payment, order
+
+
+@sync_to_async
+def discard_pending_payment(invoice_id: int) -> PendingPayment | None:
+    with transaction.atomic():
+        payment = (
+            PendingPayment.objects.select_for_update()
+            .select_related("user")
+            .filter(invoice_id=invoice_id)
+            .first()
+        )
+        if payment is not None:
+            payment.delete()
+        return payment
@@ -1,6 +1,8 @@
 from typing import Optional
 from asgiref.sync import sync_to_async
+from django.db.models import Count
 from django_project.telegrambot.usersmanage.models import Category, Product
+from queries.translation_queries import aget_translated, with_translations
 
 
 @sync_to_async
@@ -30,21 +32,18 @@ def add_product(data: dict) -> None:
     ProductTranslation.objects.bulk_create(translations)
 
 
-@sync_to_async
-def get_products(category_id: Optional[int] = None) -> list[Product]:
-    try:
-        if category_id is not None:
-            products = Product.objects.filter(category_id=int(category_id))
-        else:
-            products = Product.objects.all()
-        return list(products)
-    except Product.DoesNotExist:
-        return []
+async def get_products(
+    category_id: Optional[int] = None, language_code: str = "en"
+) -> list[Product]:
+    if category_id is not None:
+        products = Product.objects.filter(category_id=int(category_id))
+    else:
+        products = Product.objects.all()
+    return await aget_translated(products, language_code)
 
 
-@sync_to_async
-def get_product(product_id: int) -> Optional[Product]:
-    return Product.objects.filter(id=product_id).first()
+async def get_product(product_id: int) -> Optional[Product]:
+    return await with_translations(Product.objects.filter(id=product_id)).afirst()
 
 
 @sync_to_async
@@ -91,15 +90,12 @@ def delete_product(product_id: int) -> None:
     Product.objects.filter(id=product_id).delete()
 
 
-@sync_to_async
-def total_products() -> int:
-    return Product.objects.count()
+async def total_products() -> int:
+    return await Product.objects.acount()
 
 
-@sync_to_async
-def total_products_by_category() -> dict[str, int]:
-    categories = Category.objects.all()
-    category_stats = {}
-    for category in categories:
-        category_stats[category.name] = Product.objects.filter(category_id=category.id).count()
-    return category_stats
\ No newline at end of file
+async def total_products_by_category(language_code: str = "en") -> dict[str, int]:
+    categories = await aget_translated(
+        Category.objects.annotate(products_count=Count("products")), language_code
+    )
+    return {category.name: category.products_count for category in categories}
\ No newline at end of file
@@ -0,0 +1,58 @@
+from typing import Iterable, TypeVar
+
+from django.db.models import Model, Prefetch, QuerySet
+from parler.utils.i18n import get_active_language_choices
+
+T = TypeVar("T", bound=Model)
+
+
+def _get_model(model: type[Model], related: str | None) -> type[Model]:
+    for name in related.split("__") if related else ():
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def with_translations(
+    queryset: QuerySet, language_code: str = "en", related: str | None = None
+) -> QuerySet:
+    translation_model = _get_model(queryset.model, related)._parler_meta.root_model
+    lookup = f"{related}__translations" if related else "translations"
+
+    return queryset.prefetch_related(
+        Prefetch(
+            lookup,
+            queryset=translation_model.objects.filter(
+                language_code__in=get_active_language_choices(language_code)
+            ),
+        )
+    )
+
+
+def activate_translations(
+    objects: Iterable[T], language_code: str = "en", related: str | None = None
+) -> list[T]:
+    objects = list(objects)
+    for obj in objects:
+        target = obj
+        for name in related.split("__") if related else ():
+            target = getattr(target, name)
+        target.set_current_language(language_code)
+    return objects
+
+
+def get_translated(
+    queryset: QuerySet, language_code: str = "en", related: str | None = None
+) -> list:
+    return activate_translations(
+        with_translations(queryset, language_code, related), language_code, related
+    )
+
+
+async def aget_translated(
+    queryset: QuerySet, language_code: str = "en", related: str | None = None
+) -> list:
+    return activate_translations(
+        [obj async for obj in with_translations(queryset, language_code, related)],
+        language_code,
+        related,
+    )
@@ -34,14 +34,9 @@ def create_telegram_user(
         return None
 
 
-@sync_to_async
-def get_user(user_id: int) -> TelegramUser | None:
-    try:
-        return TelegramUser.objects.get(user_id=user_id)
-    except TelegramUser.DoesNotExist:
-        return None
+async def get_user(user_id: int) -> TelegramUser | None:
+    return await TelegramUser.objects.filter(user_id=user_id).afirst()
 
 
-@sync_to_async
-def total_users() -> int:
-    return TelegramUser.objects.count()
+async def total_users() -> int:
+    return await TelegramUser.objects.acount()
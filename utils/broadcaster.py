@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+
+from aiogram import Bot
+from aiogram.exceptions import (TelegramAPIError, TelegramBadRequest,
+                                TelegramRetryAfter)
+from aiogram.types import Message
+from fluentogram import TranslatorHub, TranslatorRunner
+
+from app_config import env_config
+from django_project.telegrambot.usersmanage.models import LANGUAGE, Broadcast
+from queries.broadcast_queries import (get_broadcast_recipients,
+                                       get_running_broadcasts,
+                                       save_broadcast_progress)
+from queries.language_queries import get_or_create_user_language
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class Broadcaster:
+    _tasks: dict[int, asyncio.Task] = {}
+
+    def __init__(self, bot: Bot, broadcast: Broadcast, i18n: TranslatorRunner) -> None:
+        self.bot = bot
+        self.broadcast = broadcast
+        self.i18n = i18n
+        self.bucket = TokenBucket(env_config.BROADCAST_RATE)
+        self.default_variant = next(
+            (
+                broadcast.variants[code]
+                for code, _ in LANGUAGE
+                if code in broadcast.variants
+            ),
+            next(iter(broadcast.variants.values()), None),
+        )
+        self._started_at = time.monotonic()
+        self._processed_at_start = broadcast.success_count + broadcast.error_count
+
+    @property
+    def processed(self) -> int:
+        return self.broadcast.success_count + self.broadcast.error_count
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self._started_at
+        return (self.processed - self._processed_at_start) / elapsed if elapsed else 0.0
+
+    async def _copy(self, chat_id: int, message_ids: list[int]) -> None:
+        if len(message_ids) == 1:
+            await self.bot.copy_message(
+                chat_id, self.broadcast.admin_id, message_ids[0]
+            )
+        else:
+            await self.bot.copy_messages(chat_id, self.broadcast.admin_id, message_ids)
+
+    async def _send(self, chat_id: int, language: str) -> bool:
+        message_ids = self.broadcast.variants.get(language, self.default_variant)
+        for _ in range(env_config.BROADCAST_MAX_RETRIES + 1):
+            await self.bucket.acquire()
+            try:
+                await self._copy(chat_id, message_ids)
+                return True
+            except TelegramRetryAfter as e:
+                self.bucket.pause(e.retry_after)
+            except TelegramAPIError:
+                return False
+        return False
+
+    async def _deliver(self, chat_id: int, language: str) -> None:
+        if await self._send(chat_id, language):
+            self.broadcast.success_count += 1
+        else:
+            self.broadcast.error_count += 1
+
+    def _progress_text(self) -> str:
+        return self.i18n.admin_newsletter_progress(
+            processed=self.processed,
+            total=self.broadcast.total,
+            success_count=self.broadcast.success_count,
+            error_count=self.broadcast.error_count,
+            rate=f"{self.throughput:.1f}",
+        )
+
+    async def _report_progress(self, message: Message) -> None:
+        while True:
+            await asyncio.sleep(env_config.BROADCAST_PROGRESS_INTERVAL)
+            try:
+                await message.edit_text(self._progress_text(), parse_mode="HTML")
+            except TelegramBadRequest:
+                pass
+
+    async def run(self) -> None:
+        message = await self.bot.send_message(
+            self.broadcast.admin_id, self._progress_text(), parse_mode="HTML"
+        )
+        reporter = asyncio.create_task(self._report_progress(message))
+        try:
+            batch_size = env_config.BROADCAST_BATCH_SIZE
+            while recipients := await get_broadcast_recipients(
+                self.broadcast.last_user_id, env_config.BROADCAST_CHUNK_SIZE
+            ):
+                for start in range(0, len(recipients), batch_size):
+                    batch = recipients[start : start + batch_size]
+                    await asyncio.gather(
+                        *(
+                            self._deliver(chat_id, language)
+                            for _, chat_id, language in batch
+                        )
+                    )
+                    self.broadcast.last_user_id = batch[-1][0]
+                    await save_broadcast_progress(self.broadcast)
+        finally:
+            reporter.cancel()
+
+        self.broadcast.status = "completed"
+        await save_broadcast_progress(self.broadcast)
+
+        elapsed = time.monotonic() - self._started_at
+        await self.bot.send_message(
+            self.broadcast.admin_id,
+            self.i18n.admin_newsletter_success(
+                success_count=self.broadcast.success_count,
+                error_count=self.broadcast.error_count,
+                time_taken=f"{elapsed:.2f}",
+            ),
+            parse_mode="HTML",
+        )
+
+    async def _run_logged(self) -> None:
+        try:
+            await self.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Broadcast %s failed", self.broadcast.id)
+
+    @classmethod
+    def start(cls, bot: Bot, broadcast: Broadcast, i18n: TranslatorRunner) -> None:
+        task = asyncio.create_task(cls(bot, broadcast, i18n)._run_logged())
+        task.add_done_callback(lambda _: cls._tasks.pop(broadcast.id, None))
+        cls._tasks[broadcast.id] = task
+
+    @classmethod
+    async def resume(cls, bot: Bot, translator_hub: TranslatorHub) -> None:
+        for broadcast in await get_running_broadcasts():
+            if not broadcast.variants:
+                logger.warning("Broadcast %s has no content to send", broadcast.id)
+                broadcast.status = "failed"
+                await save_broadcast_progress(broadcast)
+                continue
+
+            language = await get_or_create_user_language(broadcast.admin_id)
+            cls.start(bot, broadcast, translator_hub.get_translator_by_locale(language))
+
+    @classmethod
+    def stop_all(cls) -> None:
+        for task in list(cls._tasks.values()):
+            task.cancel()
+        cls._tasks.clear()
@@ -0,0 +1,176 @@
+import operator
+from typing import Any
+
+from aiogram import Router
+from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler
+from aiogram.dispatcher.event.handler import FilterObject, HandlerObject
+from aiogram.dispatcher.event.telegram import TelegramEventObserver
+from aiogram.filters.callback_data import CallbackQueryFilter
+from aiogram.types import CallbackQuery
+from magic_filter import MagicFilter
+from magic_filter.operations import (CallOperation, ComparatorOperation,
+                                     FunctionOperation, GetAttributeOperation)
+from magic_filter.util import in_op
+
+
+def _magic_keys(magic: MagicFilter) -> tuple[set[str], set[str]] | None:
+    operations = magic._operations
+    if not operations:
+        return None
+    first = operations[0]
+    if not isinstance(first, GetAttributeOperation) or first.name != "data":
+        return None
+
+    if len(operations) == 2:
+        operation = operations[1]
+        if (
+            isinstance(operation, ComparatorOperation)
+            and operation.comparator is operator.eq
+            and isinstance(operation.right, str)
+        ):
+            return {operation.right}, set()
+        if (
+            isinstance(operation, FunctionOperation)
+            and operation.function is in_op
+            and len(operation.args) == 1
+            and not operation.kwargs
+            and isinstance(operation.args[0], (list, tuple, set, frozenset))
+            and all(isinstance(value, str) for value in operation.args[0])
+        ):
+            return set(operation.args[0]), set()
+
+    if len(operations) == 3:
+        method, call = operations[1], operations[2]
+        if (
+            isinstance(method, GetAttributeOperation)
+            and method.name == "startswith"
+            and isinstance(call, CallOperation)
+            and len(call.args) == 1
+            and not call.kwargs
+        ):
+            prefixes = call.args[0]
+            if isinstance(prefixes, str):
+                return set(), {prefixes}
+            if isinstance(prefixes, tuple) and all(
+                isinstance(prefix, str) for prefix in prefixes
+            ):
+                return set(), set(prefixes)
+    return None
+
+
+def _filter_keys(filter_object: FilterObject) -> tuple[set[str], set[str]] | None:
+    if filter_object.magic is not None:
+        return _magic_keys(filter_object.magic)
+
+    callback = filter_object.callback
+    if isinstance(callback, CallbackQueryFilter):
+        callback_data = callback.callback_data
+        return set(), {callback_data.__prefix__ + callback_data.__separator__}
+    prefixes = getattr(callback, "callback_prefixes", None)
+    if prefixes is not None:
+        return set(), set(prefixes)
+    return None
+
+
+def handler_keys(handler: HandlerObject) -> tuple[set[str], set[str]] | None:
+    # Filters are ANDed, so any filter that pins the data down is enough.
+    for filter_object in handler.filters or ():
+        keys = _filter_keys(filter_object)
+        if keys is not None:
+            return keys
+    return None
+
+
+class IndexedCallbackObserver(TelegramEventObserver):
+    def __init__(self, router: Router, event_name: str = "callback_query") -> None:
+        super().__init__(router=router, event_name=event_name)
+        self._indexed_count = -1
+        self._exact: dict[str, set[int]] = {}
+        self._prefixes: dict[str, set[int]] = {}
+        self._prefix_lengths: tuple[int, ...] = ()
+        self._wildcards: set[int] = set()
+        self._resolved: dict[tuple, tuple[HandlerObject, ...]] = {}
+
+    def _rebuild(self) -> None:
+        self._exact.clear()
+        self._prefixes.clear()
+        self._wildcards.clear()
+        self._resolved.clear()
+        for position, handler in enumerate(self.handlers):
+            keys = handler_keys(handler)
+            if keys is None:
+                self._wildcards.add(position)
+                continue
+            exact, prefixes = keys
+            for value in exact:
+                self._exact.setdefault(value, set()).add(position)
+            for prefix in prefixes:
+                self._prefixes.setdefault(prefix, set()).add(position)
+        self._prefix_lengths = tuple(sorted({len(prefix) for prefix in self._prefixes}))
+        self._indexed_count = len(self.handlers)
+
+    def _resolve(self, keys: tuple) -> tuple[HandlerObject, ...]:
+        positions = set(self._wildcards)
+        exact, *prefixes = keys
+        if exact is not None:
+            positions |= self._exact[exact]
+        for prefix in prefixes:
+            positions |= self._prefixes[prefix]
+        handlers = tuple(self.handlers[position] for position in sorted(positions))
+        self._resolved[keys] = handlers
+        return handlers
+
+    def candidates(self, data: str | None) -> tuple[HandlerObject, ...]:
+        # Handlers are only ever appended, so the count tells when to reindex.
+        if self._indexed_count != len(self.handlers):
+            self._rebuild()
+
+        if data is None:
+            keys = (None,)
+        else:
+            keys = (data if data in self._exact else None,)
+            for length in self._prefix_lengths:
+                prefix = data[:length]
+                if prefix in self._prefixes:
+                    keys += (prefix,)
+        handlers = self._resolved.get(keys)
+        if handlers is None:
+            handlers = self._resolve(keys)
+        return handlers
+
+    async def trigger(self, event: CallbackQuery, **kwargs: Any) -> Any:
+        for handler in self.candidates(event.data):
+            kwargs["handler"] = handler
+            result, data = await handler.check(event, **kwargs)
+            if result:
+                kwargs.update(data)
+                try:
+                    wrapped_inner = self.outer_middleware.wrap_middlewares(
+                        self._resolve_middlewares(),
+                        handler.call,
+                    )
+                    return await wrapped_inner(event, kwargs)
+                except SkipHandler:
+                    continue
+
+        return UNHANDLED
+
+
+class CallbackIndex:
+    @classmethod
+    def install(cls, router: Router) -> None:
+        for child in router.chain_tail:
+            cls._install(child)
+
+    @classmethod
+    def _install(cls, router: Router) -> None:
+        current = router.callback_query
+        if isinstance(current, IndexedCallbackObserver):
+            return
+
+        observer = IndexedCallbackObserver(router=router)
+        observer.handlers = current.handlers
+        observer.middleware = current.middleware
+        observer.outer_middleware = current.outer_middleware
+        observer._handler = current._handler
+        router.callback_query = router.observers["callback_query"] = observer
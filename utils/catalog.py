@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import os
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.conf import settings
+
+from queries.catalog_queries import (get_catalog_version, get_category_rows,
+                                     get_product_category, get_product_rows)
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES: tuple[str, ...] = tuple(
+    language["code"] for language in settings.PARLER_LANGUAGES[None]
+)
+FALLBACK_LANGUAGES: tuple[str, ...] = tuple(
+    settings.PARLER_LANGUAGES["default"]["fallbacks"]
+)
+
+
+class CategoryItem(NamedTuple):
+    id: int
+    name: str
+
+
+class ProductItem(NamedTuple):
+    id: int
+    category_id: int
+    name: str
+    description: str
+    price: Decimal
+    image_path: str | None
+
+
+def _translate(translations: dict[str, tuple], language: str, default: tuple) -> tuple:
+    for code in (language, *FALLBACK_LANGUAGES):
+        if code in translations:
+            return translations[code]
+    return next(iter(translations.values()), default)
+
+
+class CatalogSnapshot:
+    _categories: dict[str, tuple[CategoryItem, ...]] = {}
+    _products: dict[str, dict[int, tuple[ProductItem, ...]]] = {}
+    _product_categories: dict[int, int] = {}
+    _version: tuple | None = None
+    _lock: asyncio.Lock | None = None
+    _watcher: asyncio.Task | None = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @staticmethod
+    def _build_products(
+        rows: list[tuple], translations: dict[int, dict[str, tuple]]
+    ) -> dict[str, dict[int, tuple[ProductItem, ...]]]:
+        products: dict[str, dict[int, list[ProductItem]]] = {
+            language: {} for language in LANGUAGES
+        }
+        for product_id, category_id, price, image in rows:
+            image_path = os.path.join(settings.MEDIA_ROOT, image) if image else None
+            for language in LANGUAGES:
+                name, description = _translate(
+                    translations.get(product_id, {}), language, ("", "")
+                )
+                products[language].setdefault(category_id, []).append(
+                    ProductItem(
+                        product_id, category_id, name, description, price, image_path
+                    )
+                )
+
+        return {
+            language: {
+                category_id: tuple(items) for category_id, items in categories.items()
+            }
+            for language, categories in products.items()
+        }
+
+    @classmethod
+    async def refresh(cls) -> None:
+        async with cls._get_lock():
+            version = await get_catalog_version()
+            category_ids, category_translations = await get_category_rows()
+            rows, product_translations = await get_product_rows()
+
+            cls._categories = {
+                language: tuple(
+                    CategoryItem(
+                        category_id,
+                        *_translate(
+                            category_translations.get(category_id, {}), language, ("",)
+                        ),
+                    )
+                    for category_id in category_ids
+                )
+                for language in LANGUAGES
+            }
+            cls._products = cls._build_products(rows, product_translations)
+            cls._product_categories = {row[0]: row[1] for row in rows}
+            cls._version = version
+
+    @classmethod
+    async def refresh_categories(cls, *category_ids: int) -> None:
+        if cls._version is None:
+            await cls.refresh()
+            return
+
+        async with cls._get_lock():
+            category_ids = [int(category_id) for category_id in category_ids]
+            rows, translations = await get_product_rows(category_ids)
+            products = cls._build_products(rows, translations)
+
+            for language in LANGUAGES:
+                language_products = dict(cls._products.get(language, {}))
+                for category_id in category_ids:
+                    language_products.pop(category_id, None)
+                language_products.update(products[language])
+                cls._products[language] = language_products
+
+            for product_id, category_id in list(cls._product_categories.items()):
+                if category_id in category_ids:
+                    del cls._product_categories[product_id]
+            cls._product_categories.update({row[0]: row[1] for row in rows})
+
+    @classmethod
+    async def refresh_product(cls, product_id: int, *category_ids: int) -> None:
+        old_category_id = cls._product_categories.get(product_id)
+        new_category_id = await get_product_category(product_id)
+
+        affected = {*category_ids, old_category_id, new_category_id} - {None}
+        if affected:
+            await cls.refresh_categories(*affected)
+
+    @classmethod
+    async def refresh_if_changed(cls) -> bool:
+        if await get_catalog_version() == cls._version:
+            return False
+        await cls.refresh()
+        return True
+
+    @classmethod
+    async def _ensure_loaded(cls) -> None:
+        if cls._version is None:
+            await cls.refresh()
+
+    @classmethod
+    async def get_categories(cls, language: str) -> tuple[CategoryItem, ...]:
+        await cls._ensure_loaded()
+        return cls._categories.get(language) or cls._categories.get(
+            FALLBACK_LANGUAGES[0], ()
+        )
+
+    @classmethod
+    async def get_products(
+        cls, category_id: int, language: str
+    ) -> tuple[ProductItem, ...]:
+        await cls._ensure_loaded()
+        products = cls._products.get(language) or cls._products.get(
+            FALLBACK_LANGUAGES[0], {}
+        )
+        return products.get(int(category_id), ())
+
+    @classmethod
+    async def _watch(cls, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await cls.refresh_if_changed()
+            except Exception:
+                logger.exception("Failed to refresh the catalog snapshot")
+
+    @classmethod
+    def start_watcher(cls, interval: float) -> None:
+        if cls._watcher is None or cls._watcher.done():
+            cls._watcher = asyncio.create_task(cls._watch(interval))
+
+    @classmethod
+    def stop_watcher(cls) -> None:
+        if cls._watcher is not None:
+            cls._watcher.cancel()
+            cls._watcher = None
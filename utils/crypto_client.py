@@ -0,0 +1,19 @@
+from app_config import env_config
+
+_client = None
+
+
+def get_crypto_client():
+    global _client
+    if _client is None:
+        from aiocryptopay import AioCryptoPay, Networks
+
+        _client = AioCryptoPay(env_config.CRYPTO_TOKEN, network=Networks.TEST_NET)
+    return _client
+
+
+async def close_crypto_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -1,16 +1,28 @@
 from decimal import Decimal
+from typing import Iterable
 
 from handlers.payment import CryptoApiManager
 
 
-async def convert_currency(amount_usd, user_language: str) -> tuple[Decimal, str]:
-    amount_usd = Decimal(amount_usd)
+async def get_currency_rate(user_language: str) -> tuple[Decimal, str]:
     if user_language == "ru":
         usd_to_rub = await CryptoApiManager.get_usd_to_rub_rate()
-        usd_to_rub = Decimal(str(usd_to_rub))
-        return amount_usd * usd_to_rub, "₽"
+        return Decimal(str(usd_to_rub)), "₽"
     else:
-        return amount_usd, "$"
+        return Decimal(1), "$"
+
+
+async def convert_currency(amount_usd, user_language: str) -> tuple[Decimal, str]:
+    rate, currency = await get_currency_rate(user_language)
+    return Decimal(amount_usd) * rate, currency
+
+
+async def convert_currencies(
+    amounts_usd: Iterable, user_language: str
+) -> tuple[list[Decimal], Decimal, str]:
+    rate, currency = await get_currency_rate(user_language)
+    converted = [Decimal(amount) * rate for amount in amounts_usd]
+    return converted, sum(converted, Decimal(0)), currency
 
 
 def format_price(amount: Decimal, currency: str) -> str:
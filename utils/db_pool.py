@@ -0,0 +1,68 @@
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    _recycler: asyncio.Task | None = None
+
+    @staticmethod
+    @sync_to_async
+    def stats() -> dict[str, int]:
+        pool = getattr(connection, "pool", None)
+        return pool.get_stats() if pool is not None else {}
+
+    @classmethod
+    async def stats_line(cls) -> str:
+        stats = await cls.stats()
+        if not stats:
+            return "pool disabled"
+        return (
+            f"{stats['pool_size']}/{stats['pool_max']} connections, "
+            f"{stats['pool_available']} idle, "
+            f"{stats['requests_waiting']} waiting, "
+            f"{stats.get('requests_num', 0)} requests "
+            f"({stats.get('requests_queued', 0)} queued, "
+            f"{stats.get('requests_errors', 0)} timed out), "
+            f"{stats.get('requests_wait_ms', 0)} ms waited"
+        )
+
+    # Outside of a request cycle nothing closes the ORM connection, so it is
+    # released periodically: back to the pool, or closed once it outlives
+    # CONN_MAX_AGE or fails its health check.
+    @staticmethod
+    @sync_to_async
+    def recycle() -> None:
+        close_old_connections()
+
+    @classmethod
+    async def _recycle_every(cls, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await cls.recycle()
+            except Exception:
+                logger.exception("Failed to recycle database connections")
+
+    @classmethod
+    def start_recycler(cls, interval: float) -> None:
+        if cls._recycler is None or cls._recycler.done():
+            cls._recycler = asyncio.create_task(cls._recycle_every(interval))
+
+    @staticmethod
+    @sync_to_async
+    def _close_connection() -> None:
+        connection.close()
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._recycler is not None:
+            cls._recycler.cancel()
+            cls._recycler = None
+        await cls._close_connection()
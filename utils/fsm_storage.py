@@ -0,0 +1,102 @@
+import json
+from functools import partial
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (BaseStorage, DefaultKeyBuilder,
+                                      KeyBuilder, StateType, StorageKey)
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.storage.redis import RedisStorage
+from django.core.serializers.json import DjangoJSONEncoder
+
+from app_config import env_config
+from queries.fsm_queries import (delete_expired_fsm_records, get_fsm_data,
+                                 get_fsm_state, set_fsm_data, set_fsm_state,
+                                 update_fsm_data)
+
+
+class RedisHashStorage(RedisStorage):
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        redis_key = self.key_builder.build(key, "data")
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(redis_key)
+            if data:
+                pipe.hset(redis_key, mapping=self._dump_fields(data))
+                if self.data_ttl:
+                    pipe.expire(redis_key, self.data_ttl)
+            await pipe.execute()
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        fields = await self.redis.hgetall(self.key_builder.build(key, "data"))
+        return self._load_fields(fields)
+
+    async def update_data(self, key: StorageKey, data: Dict[str, Any]) -> Dict[str, Any]:
+        redis_key = self.key_builder.build(key, "data")
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if data:
+                pipe.hset(redis_key, mapping=self._dump_fields(data))
+                if self.data_ttl:
+                    pipe.expire(redis_key, self.data_ttl)
+            pipe.hgetall(redis_key)
+            *_, fields = await pipe.execute()
+        return self._load_fields(fields)
+
+    def _dump_fields(self, data: Dict[str, Any]) -> Dict[str, str]:
+        return {name: self.json_dumps(value) for name, value in data.items()}
+
+    def _load_fields(self, fields: Dict[Any, Any]) -> Dict[str, Any]:
+        return {
+            name.decode("utf-8") if isinstance(name, bytes) else name: self.json_loads(value)
+            for name, value in fields.items()
+        }
+
+
+class DjangoStorage(BaseStorage):
+    def __init__(
+        self,
+        key_builder: Optional[KeyBuilder] = None,
+        state_ttl: Optional[int] = None,
+        data_ttl: Optional[int] = None,
+    ) -> None:
+        self.key_builder = key_builder or DefaultKeyBuilder(with_destiny=True)
+        self.state_ttl = state_ttl
+        self.data_ttl = data_ttl
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        state = state.state if isinstance(state, State) else state
+        await set_fsm_state(self.key_builder.build(key), state, self.state_ttl)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        return await get_fsm_state(self.key_builder.build(key))
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        await set_fsm_data(self.key_builder.build(key), data, self.data_ttl)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        return await get_fsm_data(self.key_builder.build(key))
+
+    async def update_data(self, key: StorageKey, data: Dict[str, Any]) -> Dict[str, Any]:
+        return await update_fsm_data(self.key_builder.build(key), data, self.data_ttl)
+
+    async def purge_expired(self) -> int:
+        return await delete_expired_fsm_records()
+
+    async def close(self) -> None:
+        pass
+
+
+def build_fsm_storage() -> BaseStorage:
+    if env_config.FSM_STORAGE == "redis":
+        return RedisHashStorage.from_url(
+            env_config.REDIS_URL,
+            key_builder=DefaultKeyBuilder(with_destiny=True),
+            state_ttl=env_config.FSM_STATE_TTL or None,
+            data_ttl=env_config.FSM_DATA_TTL or None,
+            json_dumps=partial(json.dumps, cls=DjangoJSONEncoder),
+        )
+    if env_config.FSM_STORAGE == "postgres":
+        return DjangoStorage(
+            state_ttl=env_config.FSM_STATE_TTL or None,
+            data_ttl=env_config.FSM_DATA_TTL or None,
+        )
+    return MemoryStorage()
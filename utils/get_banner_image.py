@@ -1,10 +1,11 @@
 import os
 
-from aiogram.types import FSInputFile, InputMediaPhoto
+from aiogram.types import InputMediaPhoto
 from django.conf import settings
 from fluentogram import TranslatorRunner
 
 from queries.banner_queries import get_banner
+from utils.media_cache import MediaCache
 
 
 async def get_banner_image(menu_name: str, i18n: TranslatorRunner) -> InputMediaPhoto:
@@ -18,6 +19,6 @@ async def get_banner_image(menu_name: str, i18n: TranslatorRunner) -> InputMedia
         raise FileNotFoundError(i18n.banner_image_not_found(path=image_path))
 
     return InputMediaPhoto(
-        media=FSInputFile(image_path),
+        media=await MediaCache.get_photo(image_path),
         caption=str(banner.description) if banner.description else ""
     )
@@ -0,0 +1,56 @@
+import os
+from typing import Any
+
+from aiogram.types import FSInputFile, Message
+
+from queries.media_queries import (delete_media_file, get_media_files,
+                                   save_media_file)
+
+
+class MediaCache:
+    _file_ids: dict[str, tuple[str, str]] = {}
+    _loaded: bool = False
+
+    @staticmethod
+    def _fingerprint(path: str) -> str:
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    @classmethod
+    async def _load(cls) -> None:
+        if not cls._loaded:
+            cls._file_ids.update(await get_media_files())
+            cls._loaded = True
+
+    @classmethod
+    async def get_photo(cls, path: str) -> str | FSInputFile:
+        await cls._load()
+
+        path = str(path)
+        cached = cls._file_ids.get(path)
+        if cached and cached[0] == cls._fingerprint(path):
+            return cached[1]
+        return FSInputFile(path)
+
+    @classmethod
+    async def remember(cls, media: Any, message: Any) -> None:
+        if not isinstance(media, FSInputFile):
+            return
+        if not isinstance(message, Message) or not message.photo:
+            return
+
+        path = str(media.path)
+        try:
+            fingerprint = cls._fingerprint(path)
+        except OSError:
+            return
+
+        file_id = message.photo[-1].file_id
+        cls._file_ids[path] = (fingerprint, file_id)
+        await save_media_file(path, fingerprint, file_id)
+
+    @classmethod
+    async def invalidate(cls, path: str) -> None:
+        path = str(path)
+        cls._file_ids.pop(path, None)
+        await delete_media_file(path)
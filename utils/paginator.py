@@ -45,3 +45,20 @@ class Paginator:
         raise IndexError(
             "Previous page does not exist. Use has_previous() to check if there is a previous page"
         )
+
+
+class QuerySetPaginator(Paginator):
+    def __init__(self, queryset, page: int = 1, per_page: int = 1, count: int | None = None):
+        self.array = queryset
+        self.per_page = per_page
+        self.len = queryset.count() if count is None else count
+
+        self.pages = math.ceil(self.len / self.per_page)
+        self.page = min(max(page, 1), self.pages) if self.pages else 1
+
+    def get_page(self):
+        return list(super().get_page())
+
+    async def aget_page(self):
+        start = (self.page - 1) * self.per_page
+        return [obj async for obj in self.array[start : start + self.per_page]]
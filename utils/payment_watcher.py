@@ -0,0 +1,120 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, NamedTuple
+
+from aiohttp import web
+
+from utils.crypto_client import get_crypto_client
+
+logger = logging.getLogger(__name__)
+
+PaymentCallback = Callable[[], Awaitable[None]]
+
+
+class WatchedInvoice(NamedTuple):
+    expires_at: float
+    on_paid: PaymentCallback
+    on_expired: PaymentCallback
+
+
+class PaymentWatcher:
+    BATCH_SIZE: int = 100
+
+    _invoices: dict[int, WatchedInvoice] = {}
+    _callbacks: set[asyncio.Task] = set()
+    _poller: asyncio.Task | None = None
+
+    @classmethod
+    def watch(
+        cls,
+        invoice_id: int,
+        on_paid: PaymentCallback,
+        on_expired: PaymentCallback,
+        timeout: float,
+    ) -> None:
+        cls._invoices[invoice_id] = WatchedInvoice(
+            time.monotonic() + timeout, on_paid, on_expired
+        )
+
+    @classmethod
+    def unwatch(cls, invoice_id: int) -> None:
+        cls._invoices.pop(invoice_id, None)
+
+    @staticmethod
+    async def _run_callback(callback: PaymentCallback) -> None:
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Payment callback failed")
+
+    @classmethod
+    def _dispatch(cls, callback: PaymentCallback) -> None:
+        task = asyncio.create_task(cls._run_callback(callback))
+        cls._callbacks.add(task)
+        task.add_done_callback(cls._callbacks.discard)
+
+    @classmethod
+    def resolve(cls, invoice_id: int) -> bool:
+        invoice = cls._invoices.pop(invoice_id, None)
+        if invoice is None:
+            return False
+        cls._dispatch(invoice.on_paid)
+        return True
+
+    @classmethod
+    async def poll(cls) -> None:
+        invoice_ids = list(cls._invoices)
+        for start in range(0, len(invoice_ids), cls.BATCH_SIZE):
+            batch = invoice_ids[start : start + cls.BATCH_SIZE]
+            try:
+                invoices = await get_crypto_client().get_invoices(
+                    invoice_ids=batch, status="paid", count=len(batch)
+                )
+            except Exception:
+                logger.exception("Failed to fetch %d invoices", len(batch))
+                continue
+
+            for invoice in invoices or []:
+                cls.resolve(invoice.invoice_id)
+
+        now = time.monotonic()
+        for invoice_id, invoice in list(cls._invoices.items()):
+            if invoice.expires_at <= now:
+                del cls._invoices[invoice_id]
+                cls._dispatch(invoice.on_expired)
+
+    @classmethod
+    async def _watch(cls, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if cls._invoices:
+                await cls.poll()
+
+    @classmethod
+    def start(cls, interval: float) -> None:
+        if cls._poller is None or cls._poller.done():
+            cls._poller = asyncio.create_task(cls._watch(interval))
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls._poller is not None:
+            cls._poller.cancel()
+            cls._poller = None
+
+    @classmethod
+    async def handle_update(cls, request: web.Request) -> web.Response:
+        body = await request.text()
+        signature = request.headers.get("Crypto-Pay-Api-Signature", "")
+        if not get_crypto_client().check_signature(body, signature):
+            return web.Response(text="Unauthorized", status=401)
+
+        update = json.loads(body)
+        if update.get("update_type") == "invoice_paid":
+            cls.resolve(update["payload"]["invoice_id"])
+        return web.Response(text="OK")
+
+    @classmethod
+    def register(cls, app: web.Application, path: str) -> None:
+        app.router.add_post(path, cls.handle_update)
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import os
+from typing import Iterable
+
+from app_config import env_config
+from utils.text_processing import (get_restricted_words, normalize_text,
+                                   normalize_variants)
+
+logger = logging.getLogger(__name__)
+
+STEM_MARK = "*"
+# A letter repeated this many times is taken as stretched ("fuuuck") rather
+# than spelled, so it stands for any number of that letter in a term.
+STRETCHED_RUN = 3
+
+
+def _runs(text: str) -> tuple[list[str], list[int]]:
+    chars, counts = [], []
+    previous = None
+    for char in text:
+        if char == previous:
+            counts[-1] += 1
+        else:
+            chars.append(char)
+            counts.append(1)
+            previous = char
+    return chars, counts
+
+
+class RestrictedWordsMatcher:
+    # Aho-Corasick automaton over normalized text. Patterns are wrapped in spaces,
+    # so a plain substring match only fires on whole words and phrases, while
+    # stems ("word*") leave the closing space out and match any word they start.
+    # The automaton runs over letter runs ("fuuuck" is f-u-c-k), and a match
+    # is then confirmed run by run: each run in the text must be as long as in
+    # the term or stretched, so "ass" doesn't fire on "as" and "as" not on "ass".
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[str, tuple[int, ...], bool]]] = [[]]
+        self._output_link: list[int] = [0]
+        self.size = 0
+
+        for term in terms:
+            self._add(term.strip())
+        self._link()
+
+    def _add(self, term: str) -> None:
+        stem = term.endswith(STEM_MARK)
+        body = normalize_text(term.rstrip(STEM_MARK))
+        if not body:
+            return
+
+        chars, counts = _runs(f" {body}" if stem else f" {body} ")
+        state = 0
+        for char in chars:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._output_link.append(0)
+            state = next_state
+
+        if all(output[0] != term for output in self._output[state]):
+            self._output[state].append((term, tuple(counts), stem))
+            self.size += 1
+
+    def _link(self) -> None:
+        goto, fail, output, output_link = (
+            self._goto,
+            self._fail,
+            self._output,
+            self._output_link,
+        )
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                suffix = fail[next_state]
+                output_link[next_state] = (
+                    suffix if output[suffix] else output_link[suffix]
+                )
+                queue.append(next_state)
+
+    def find(self, text: str) -> str | None:
+        for variant in normalize_variants(text):
+            term = self._find(variant)
+            if term is not None:
+                return term
+        return None
+
+    def _find(self, text: str) -> str | None:
+        goto, fail, output, output_link = (
+            self._goto,
+            self._fail,
+            self._output,
+            self._output_link,
+        )
+        chars, counts = _runs(f" {text} ")
+        state = 0
+        for position, char in enumerate(chars):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            match = state if output[state] else output_link[state]
+            while match:
+                for term, runs, stem in output[match]:
+                    if self._runs_match(runs, stem, counts, position - len(runs) + 1):
+                        return term
+                match = output_link[match]
+        return None
+
+    @staticmethod
+    def _runs_match(
+        runs: tuple[int, ...], stem: bool, counts: list[int], start: int
+    ) -> bool:
+        *runs, last = runs
+        for offset, required in enumerate(runs):
+            count = counts[start + offset]
+            if count != required and count < STRETCHED_RUN:
+                return False
+        # A stem only fixes the start of the word, so its last letter may go on.
+        count = counts[start + len(runs)]
+        return count == last or count >= (last if stem else STRETCHED_RUN)
+
+
+class RestrictedWords:
+    path: str = env_config.RESTRICTED_WORDS_PATH
+    _matcher: RestrictedWordsMatcher | None = None
+    _signature: tuple[int, int] | None = None
+    _watcher: asyncio.Task | None = None
+
+    @classmethod
+    def _file_signature(cls) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(cls.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def load(cls) -> None:
+        signature = cls._file_signature()
+        cls._matcher = RestrictedWordsMatcher(get_restricted_words(cls.path))
+        cls._signature = signature
+        logger.info("Loaded %d restricted words from %s", cls._matcher.size, cls.path)
+
+    @classmethod
+    async def reload_if_changed(cls) -> bool:
+        if cls._matcher is not None and cls._file_signature() == cls._signature:
+            return False
+        await asyncio.to_thread(cls.load)
+        return True
+
+    @classmethod
+    def find(cls, text: str) -> str | None:
+        if cls._matcher is None:
+            cls.load()
+        return cls._matcher.find(text)
+
+    @classmethod
+    async def _watch(cls, interval: float) -> None:
+        while True:
+            try:
+                await cls.reload_if_changed()
+            except Exception:
+                logger.exception("Failed to reload restricted words")
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def start_watcher(cls, interval: float) -> None:
+        if cls._watcher is None or cls._watcher.done():
+            cls._watcher = asyncio.create_task(cls._watch(interval))
+
+    @classmethod
+    def stop_watcher(cls) -> None:
+        if cls._watcher is not None:
+            cls._watcher.cancel()
+            cls._watcher = None
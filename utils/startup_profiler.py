@@ -0,0 +1,93 @@
+import _frozen_importlib
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    TOP_IMPORTS: int = 25
+
+    enabled: bool = False
+    _awaiting_update: bool = False
+    _started_at: float = 0.0
+    _thread_id: int | None = None
+    _find_and_load: Callable | None = None
+    _imports: dict[str, tuple[float, float]] = {}
+    _children: list[float] = []
+    _marks: list[tuple[str, float]] = []
+
+    @classmethod
+    def _timed_find_and_load(cls, name: str, import_: Callable) -> Any:
+        if threading.get_ident() != cls._thread_id:
+            return cls._find_and_load(name, import_)
+
+        cls._children.append(0.0)
+        started_at = time.perf_counter()
+        try:
+            return cls._find_and_load(name, import_)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            children = cls._children.pop()
+            cls._imports[name] = (elapsed, elapsed - children)
+            if cls._children:
+                cls._children[-1] += elapsed
+
+    @classmethod
+    def install(cls) -> None:
+        if cls.enabled:
+            return
+        cls.enabled = True
+        cls._awaiting_update = True
+        cls._started_at = time.perf_counter()
+        cls._thread_id = threading.get_ident()
+        cls._find_and_load = _frozen_importlib._find_and_load
+        _frozen_importlib._find_and_load = cls._timed_find_and_load
+
+    @classmethod
+    def uninstall(cls) -> None:
+        if cls._find_and_load is not None:
+            _frozen_importlib._find_and_load = cls._find_and_load
+            cls._find_and_load = None
+
+    @classmethod
+    def mark(cls, label: str) -> None:
+        if cls.enabled:
+            cls._marks.append((label, time.perf_counter() - cls._started_at))
+
+    @classmethod
+    def report(cls) -> None:
+        cls.uninstall()
+        for label, elapsed in cls._marks:
+            logger.info("%-20s %8.1f ms", label, elapsed * 1000)
+
+        imports = sorted(
+            cls._imports.items(), key=lambda item: item[1][1], reverse=True
+        )
+        logger.info("%d modules imported, slowest by self time:", len(imports))
+        for name, (cumulative, own) in imports[: cls.TOP_IMPORTS]:
+            logger.info(
+                "%8.1f ms self %8.1f ms cumulative  %s",
+                own * 1000,
+                cumulative * 1000,
+                name,
+            )
+
+    @classmethod
+    async def first_update_middleware(
+        cls,
+        handler: Callable[[Any, dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: dict[str, Any],
+    ) -> Any:
+        if not cls._awaiting_update:
+            return await handler(event, data)
+
+        cls._awaiting_update = False
+        try:
+            return await handler(event, data)
+        finally:
+            cls.mark("first update")
+            cls.report()
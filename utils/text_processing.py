@@ -1,9 +1,62 @@
+import unicodedata
 from string import punctuation
 from typing import Set
 
+PUNCTUATION_TABLE = str.maketrans("", "", punctuation)
+
+# Look-alike letters and digits, mapped to the letter they are used to imitate.
+HOMOGLYPHS = {
+    "а": "a",
+    "в": "b",
+    "е": "e",
+    "к": "k",
+    "м": "m",
+    "н": "h",
+    "о": "o",
+    "р": "p",
+    "с": "c",
+    "т": "t",
+    "у": "y",
+    "х": "x",
+    "і": "i",
+    "0": "o",
+    "1": "i",
+    "3": "e",
+    "4": "a",
+    "@": "a",
+    "$": "s",
+}
+INVISIBLE = "\u00ad\u200b\u200c\u200d\u2060\ufeff"
+COMBINING_MARKS = "".join(map(chr, range(0x300, 0x370)))
+
+SEPARATORS = punctuation.replace("@", "").replace("$", "") + "«»“”‘’„…–—¡¿"
+
+NORMALIZE_TABLE = str.maketrans(
+    {**HOMOGLYPHS, **dict.fromkeys(INVISIBLE + COMBINING_MARKS)}
+)
+SPACED_TABLE = str.maketrans(dict.fromkeys(SEPARATORS, " "))
+JOINED_TABLE = str.maketrans(dict.fromkeys(SEPARATORS))
+
 
 def clean_text(text: str) -> str:
-    return text.translate(str.maketrans("", "", punctuation))
+    return text.translate(PUNCTUATION_TABLE)
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKD", text.casefold()).translate(NORMALIZE_TABLE)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(_normalize(text).translate(SPACED_TABLE).split())
+
+
+def normalize_variants(text: str) -> tuple[str, ...]:
+    # Punctuation mostly separates words ("ok,fine"), but is also put inside
+    # a word to hide it ("f.u.c.k"), so text with punctuation is read both ways.
+    text = _normalize(text)
+    spaced = " ".join(text.translate(SPACED_TABLE).split())
+    joined = " ".join(text.translate(JOINED_TABLE).split())
+    return (spaced,) if spaced == joined else (spaced, joined)
 
 
 def get_restricted_words(file_path: str = "files/restricted_words.txt") -> Set[str]: